@@ -1,14 +1,21 @@
 """Main agent orchestrator"""
 
 import signal
+import sqlite3
 import sys
-from typing import Optional
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Iterator, Optional
 
-from .ai import ThreatAnalyzer
+from .ai import CircuitBreaker, HistoryTracker, ThreatAnalyzer
+from .ai.breaker import CLOSED, HALF_OPEN, OPEN
 from .config import Settings
 from .log_watcher import watch_log_file
 from .notifiers import DiscordNotifier, SlackNotifier
-from .parsers import parse_auth_log_line
+from .parsers import FAILED_LOGIN_EVENT_TYPES, AuthLogEvent, AuthLogParser, AuthPattern
+from .scheduler import AnalysisQueue, QueuedEvent, score_event, severity_at_least
+from .store import EventStore
 
 
 class HomeLabGuardian:
@@ -16,10 +23,24 @@ class HomeLabGuardian:
 
     def __init__(self, settings: Optional[Settings] = None):
         self.settings = settings or Settings()
+
+        # Rule-only mode while the model server is down or slow
+        self.breaker = CircuitBreaker(
+            failure_threshold=self.settings.breaker_failure_threshold,
+            latency_threshold=self.settings.breaker_latency_threshold,
+            reset_timeout=self.settings.breaker_reset_timeout,
+            probe=lambda: self.analyzer.probe(),
+        )
+        self.breaker.add_listener(self._on_llm_state_change)
         self.analyzer = ThreatAnalyzer(
-            base_url=self.settings.ollama_base_url, model=self.settings.ollama_model
+            base_url=self.settings.ollama_base_url,
+            model=self.settings.ollama_model,
+            timeout=self.settings.llm_timeout,
+            breaker=self.breaker,
         )
 
+        self.parser = AuthLogParser(AuthPattern(**p) for p in self.settings.auth_patterns)
+
         # Initialize notifiers
         self.notifiers = []
         if self.settings.discord_webhook_url:
@@ -27,12 +48,48 @@ class HomeLabGuardian:
         if self.settings.slack_webhook_url:
             self.notifiers.append(SlackNotifier(self.settings.slack_webhook_url))
 
+        # Event history
+        self.store = None
+        if self.settings.store_path:
+            try:
+                self.store = EventStore(
+                    self.settings.store_path, retention_days=self.settings.store_retention_days
+                )
+            except (OSError, sqlite3.Error) as e:
+                print(f"⚠️  Event store disabled ({self.settings.store_path}): {e}")
+
+        # Rolling per-IP/user aggregates for prompt context, seeded from the last day of history
+        self.history = HistoryTracker(token_budget=self.settings.context_token_budget)
+        if self.store:
+            recent = self.store.query(since=datetime.now() - timedelta(days=1), limit=10000)
+            for stored in reversed(recent):
+                self.history.record(stored.event)
+                if stored.verdict:
+                    self.history.record_verdict(
+                        stored.event, stored.verdict, bool(stored.is_threat)
+                    )
+
+        # Analyzer input, highest priority first
+        self.queue = AnalysisQueue(
+            maxsize=self.settings.queue_max_size,
+            aging_per_minute=self.settings.priority_aging_per_minute,
+        )
+
         self.running = True
 
     def start(self) -> None:
         """Start monitoring logs"""
         print(f"🛡️  Home Lab Guardian starting...")
-        print(f"📁 Monitoring: {self.settings.log_path}")
+        if self.settings.log_source == "journal":
+            print(f"📁 Monitoring: journald ({', '.join(self.settings.journal_matches)})")
+        elif self.settings.log_source == "syslog":
+            print(
+                f"📡 Collecting syslog on {self.settings.collector_bind} "
+                f"(udp {self.settings.collector_udp_port or 'off'}, "
+                f"tcp {self.settings.collector_tcp_port or 'off'})"
+            )
+        else:
+            print(f"📁 Monitoring: {self.settings.log_path}")
         print(f"🤖 AI Model: {self.settings.ollama_model}")
         print(f"📢 Notifiers: {len(self.notifiers)} configured")
         print("=" * 60)
@@ -41,34 +98,16 @@ class HomeLabGuardian:
         signal.signal(signal.SIGINT, self._signal_handler)
         signal.signal(signal.SIGTERM, self._signal_handler)
 
+        # Analysis runs in its own thread so ingestion never waits on the LLM
+        worker = threading.Thread(target=self._analysis_worker, name="hlg-analyzer", daemon=True)
+        worker.start()
+
         try:
-            for line in watch_log_file(self.settings.log_path, self.settings.poll_interval):
+            for event in self._events():
                 if not self.running:
                     break
 
-                # Parse the log line
-                event = parse_auth_log_line(line)
-                if not event:
-                    continue
-
-                # Filter based on settings
-                if not self._should_alert(event):
-                    continue
-
-                print(f"\n⚠️  Event detected: {event.event_type} - {event.username}")
-
-                # Analyze with AI
-                try:
-                    analysis = self.analyzer.analyze(event)
-                    print(f"🔍 Severity: {analysis.severity.upper()}")
-                    print(f"💡 {analysis.explanation}")
-
-                    # Send notifications if it's a real threat
-                    if analysis.is_threat:
-                        self._send_notifications(event, analysis)
-
-                except Exception as e:
-                    print(f"❌ Analysis failed: {e}")
+                self._ingest(event)
 
         except KeyboardInterrupt:
             pass
@@ -76,11 +115,121 @@ class HomeLabGuardian:
             print(f"❌ Fatal error: {e}")
             sys.exit(1)
         finally:
+            self.running = False
+            unprocessed = self.queue.close()
+            worker.join(timeout=30)
+            if worker.is_alive():
+                print("⚠️  Analyzer still busy after 30s; its current event will not be recorded")
+            if self.store:
+                # Keep history complete for events that never got analyzed
+                for item in unprocessed:
+                    self.store.add(item.event)
+                self.store.close()
             print("\n🛑 Home Lab Guardian stopped.")
 
+    def _ingest(self, event: AuthLogEvent) -> None:
+        """Record an event and queue it for analysis if it passes the filters"""
+        if not self._should_alert(event):
+            self.history.record(event)
+            if self.store:
+                self.store.add(event)
+            return
+
+        # Context and score describe prior activity, so compute them before recording
+        history = self.history.summary(event)
+        priority = score_event(event, self.history.recent_count(event))
+        self.history.record(event)
+
+        dropped = self.queue.put(event, priority, history)
+        if dropped:
+            # Skip analysis for the least important event but keep it in history
+            print(
+                f"⚠️  Analysis queue full, dropped {dropped.event.event_type} "
+                f"from {dropped.event.source_ip}"
+            )
+            if self.store:
+                self.store.add(dropped.event)
+
+    def _analysis_worker(self) -> None:
+        """Analyze queued events, highest priority first, until the queue is closed"""
+        # Load the LLM stack here rather than at startup, so ingestion starts immediately
+        try:
+            self.analyzer.llm
+        except Exception as e:
+            print(f"❌ Failed to load LLM client: {e}")
+
+        while True:
+            item = self.queue.get()
+            if item is None:
+                return
+            self._analyze(item)
+
+    def _analyze(self, item: QueuedEvent) -> None:
+        """Analyze one queued event, notify if needed, then record it"""
+        event = item.event
+        analysis = None
+        waited = time.monotonic() - item.enqueued_at
+        print(
+            f"\n⚠️  Event detected: {event.event_type} - {event.username} "
+            f"(priority {item.priority:.1f}, queued {waited:.1f}s)"
+        )
+
+        # Analyze with AI, with the prior activity of this IP/user as context
+        try:
+            analysis = self.analyzer.analyze(event, item.history)
+            self.history.record_verdict(event, analysis.severity, analysis.is_threat)
+            print(f"🔍 Severity: {analysis.severity.upper()}")
+            print(f"💡 {analysis.explanation}")
+
+            # Send notifications if it's a real threat
+            if analysis.is_threat:
+                self._send_notifications(event, analysis)
+
+        except Exception as e:
+            print(f"❌ Analysis failed: {e}")
+
+        if self.store:
+            self.store.add(event, analysis)
+
+    def _events(self) -> Iterator[AuthLogEvent]:
+        """Yield parsed events from the configured source"""
+        if self.settings.log_source == "journal":
+            from .journal_watcher import watch_journal
+
+            # journald provides structured fields, no line parsing needed
+            yield from watch_journal(
+                self.settings.journal_matches,
+                self.settings.journal_cursor_file,
+                self.settings.poll_interval,
+                self.parser,
+            )
+            return
+        if self.settings.log_source == "syslog":
+            from .collector import SyslogCollector, watch_syslog
+
+            # Many hosts, one analysis pipeline and one LLM client
+            yield from watch_syslog(
+                SyslogCollector(
+                    self.parser,
+                    bind=self.settings.collector_bind,
+                    udp_port=self.settings.collector_udp_port or None,
+                    tcp_port=self.settings.collector_tcp_port or None,
+                ),
+                self.settings.poll_interval,
+                lambda: self.running,
+            )
+            return
+
+        for line in watch_log_file(self.settings.log_path, self.settings.poll_interval):
+            event = self.parser.parse(line)
+            if event:
+                yield event
+
     def _should_alert(self, event) -> bool:
         """Determine if we should analyze and potentially alert on this event"""
-        if event.event_type == "failed_login" and self.settings.alert_on_failed_login:
+        if not severity_at_least(event.severity, self.settings.min_severity):
+            return False
+        if event.event_type in FAILED_LOGIN_EVENT_TYPES and self.settings.alert_on_failed_login:
             return True
         if event.event_type == "sudo" and self.settings.alert_on_sudo:
             return True
@@ -98,6 +247,27 @@ class HomeLabGuardian:
             except Exception as e:
                 print(f"❌ Notification error ({notifier.__class__.__name__}): {e}")
 
+    def _on_llm_state_change(self, old_state: str, new_state: str, reason: str) -> None:
+        """Report circuit breaker transitions as a metric line and a notification"""
+        count = self.breaker.transitions[(old_state, new_state)]
+        print(
+            f'📈 hlg_llm_circuit_transitions_total{{from="{old_state}",to="{new_state}"}} {count} '
+            f"({reason})"
+        )
+
+        titles = {
+            OPEN: "AI analysis degraded (rule-based mode)",
+            HALF_OPEN: "AI analysis: probing model server",
+            CLOSED: "AI analysis restored",
+        }
+        title, message = titles[new_state], f"{old_state} → {new_state}: {reason}"
+
+        # Webhooks can be slow; keep them off the analysis path
+        for notifier in self.notifiers:
+            threading.Thread(
+                target=notifier.send_status, args=(title, message), daemon=True
+            ).start()
+
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals gracefully"""
         print("\n⚠️  Shutdown signal received...")
@@ -1,5 +1,7 @@
 """AI analyzer initialization"""
 
 from .analyzer import ThreatAnalysis, ThreatAnalyzer
+from .breaker import CircuitBreaker
+from .context import HistoryTracker
 
-__all__ = ["ThreatAnalyzer", "ThreatAnalysis"]
+__all__ = ["CircuitBreaker", "HistoryTracker", "ThreatAnalyzer", "ThreatAnalysis"]
@@ -1,12 +1,15 @@
-"""AI-powered threat analysis using LangChain and Ollama"""
+"""AI-powered threat analysis using LangChain and Ollama
 
-from dataclasses import dataclass
-from typing import Optional
+LangChain is imported on first use: loading it takes seconds on small
+machines and most CLI commands never talk to the model.
+"""
 
-from langchain_core.messages import HumanMessage, SystemMessage
-from langchain_ollama import ChatOllama
+import time
+from dataclasses import dataclass
+from typing import Any, Optional
 
-from ..parsers import AuthLogEvent
+from ..parsers import FAILED_LOGIN_EVENT_TYPES, AuthLogEvent
+from .breaker import CircuitBreaker
 
 
 @dataclass
@@ -22,19 +25,60 @@ class ThreatAnalysis:
 class ThreatAnalyzer:
     """Analyze log events using local LLM via Ollama"""
 
-    def __init__(self, base_url: str = "http://localhost:11434", model: str = "llama3.1:8b"):
-        self.llm = ChatOllama(base_url=base_url, model=model, temperature=0.3)
+    def __init__(
+        self,
+        base_url: str = "http://localhost:11434",
+        model: str = "llama3.1:8b",
+        timeout: Optional[float] = None,
+        breaker: Optional[CircuitBreaker] = None,
+    ):
+        self.base_url = base_url
+        self.model = model
+        self.timeout = timeout
+        self.breaker = breaker
+        self._llm: Any = None  # BaseChatModel, or a test double
+
+    @property
+    def llm(self) -> Any:
+        """LangChain chat model, created (and LangChain imported) on first use"""
+        if self._llm is None:
+            from langchain_ollama import ChatOllama
+
+            client_kwargs = {"timeout": self.timeout} if self.timeout else {}
+            self._llm = ChatOllama(
+                base_url=self.base_url,
+                model=self.model,
+                temperature=0.3,
+                client_kwargs=client_kwargs,
+            )
+        return self._llm
+
+    @llm.setter
+    def llm(self, llm: Any) -> None:
+        self._llm = llm
+
+    def probe(self) -> None:
+        """Minimal request used to check that the model server is back; raises on failure"""
+        from langchain_core.messages import HumanMessage
 
-    def analyze(self, event: AuthLogEvent) -> ThreatAnalysis:
+        self.llm.invoke([HumanMessage(content="Reply with OK.")])
+
+    def analyze(self, event: AuthLogEvent, history: Optional[str] = None) -> ThreatAnalysis:
         """
         Analyze a log event and determine if it's a threat
 
         Args:
             event: Parsed log event
+            history: Precomputed summary of prior activity for the event's IP/user
+                (see HistoryTracker.summary)
 
         Returns:
             ThreatAnalysis with severity, explanation, and recommendations
         """
+        # Degraded mode: don't wait on a model server that is known to be down or slow
+        if self.breaker and not self.breaker.allow():
+            return self._fallback_analysis(event)
+
         # Build context for the LLM
         context = f"""
 Event Type: {event.event_type}
@@ -43,6 +87,11 @@ Username: {event.username or 'N/A'}
 Source IP: {event.source_ip or 'N/A'}
 Message: {event.message}
 Initial Severity: {event.severity}
+"""
+        if history:
+            context += f"""
+Recent history:
+{history}
 """
 
         system_prompt = """You are a cybersecurity expert analyzing Linux authentication logs. 
@@ -52,6 +101,7 @@ Your task is to:
 3. Provide 2-3 actionable recommendations
 4. Determine if this is a real threat or normal activity
 
+When recent history is provided, use it to tell a one-off mistake from a sustained attack.
 Be concise but helpful. Focus on practical advice for system administrators."""
 
         user_prompt = f"""Analyze this authentication event and provide:
@@ -73,12 +123,20 @@ IS_THREAT: [yes/no]
 """
 
         try:
+            # Inside the try: a missing or broken LLM stack is an LLM failure too
+            from langchain_core.messages import HumanMessage, SystemMessage
+
             messages = [SystemMessage(content=system_prompt), HumanMessage(content=user_prompt)]
 
+            start = time.monotonic()
             response = self.llm.invoke(messages)
+            if self.breaker:
+                self.breaker.record_success(time.monotonic() - start)
             return self._parse_response(response.content, event)
 
         except Exception as e:
+            if self.breaker:
+                self.breaker.record_failure(f"{e.__class__.__name__}: {e}")
             # Fallback to rule-based analysis if LLM fails
             return self._fallback_analysis(event)
 
@@ -112,7 +170,7 @@ IS_THREAT: [yes/no]
 
     def _fallback_analysis(self, event: AuthLogEvent) -> ThreatAnalysis:
         """Rule-based fallback analysis when LLM is unavailable"""
-        if event.event_type == "failed_login":
+        if event.event_type in FAILED_LOGIN_EVENT_TYPES:
             return ThreatAnalysis(
                 severity="high",
                 explanation=f"Failed login attempt for user '{event.username}' from {event.source_ip}. This could indicate a brute-force attack.",
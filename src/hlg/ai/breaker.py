@@ -0,0 +1,133 @@
+"""Circuit breaker guarding the LLM client"""
+
+import threading
+import time
+from collections import Counter
+from typing import Callable, Optional
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# (old state, new state, reason)
+StateListener = Callable[[str, str, str], None]
+
+
+class CircuitBreaker:
+    """
+    Track LLM latency and errors and stop calling it when it misbehaves
+
+    closed: requests go through. Errors and calls slower than
+        ``latency_threshold`` count as failures; ``failure_threshold``
+        consecutive failures open the circuit.
+    open: requests are refused (callers use rule-based analysis). After
+        ``reset_timeout`` a single probe is allowed through.
+    half_open: a probe is in flight; success closes the circuit, failure
+        opens it again for another ``reset_timeout``.
+
+    If a ``probe`` callable is given, probes run in a background thread so
+    no real event has to wait for a possibly dead server.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        latency_threshold: float = 20.0,
+        reset_timeout: float = 60.0,
+        probe: Optional[Callable[[], None]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.latency_threshold = latency_threshold
+        self.reset_timeout = reset_timeout
+        self.probe = probe
+        self.clock = clock
+
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.last_latency: Optional[float] = None
+        self.transitions: Counter = Counter()  # (old, new) -> count
+        self._opened_at = 0.0
+        self._listeners: list[StateListener] = []
+        self._lock = threading.Lock()
+
+    def add_listener(self, listener: StateListener) -> None:
+        """Call ``listener(old, new, reason)`` on every state change"""
+        self._listeners.append(listener)
+
+    def _transition(self, new_state: str, reason: str) -> Optional[tuple[str, str, str]]:
+        """Change state (lock held); returns the change to announce, if any"""
+        old_state = self.state
+        if old_state == new_state:
+            return None
+        self.state = new_state
+        self.transitions[(old_state, new_state)] += 1
+        if new_state == OPEN:
+            self._opened_at = self.clock()
+        if new_state == CLOSED:
+            self.consecutive_failures = 0
+        return old_state, new_state, reason
+
+    def _announce(self, change: Optional[tuple[str, str, str]]) -> None:
+        """Notify listeners outside the lock"""
+        if not change:
+            return
+        for listener in self._listeners:
+            try:
+                listener(*change)
+            except Exception as e:
+                print(f"❌ Circuit breaker listener failed: {e}")
+
+    def allow(self) -> bool:
+        """Whether a real request may be sent to the LLM now"""
+        run_probe = False
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            if self.state == HALF_OPEN or self.clock() - self._opened_at < self.reset_timeout:
+                return False
+            change = self._transition(HALF_OPEN, "probing after cooldown")
+            run_probe = self.probe is not None
+        self._announce(change)
+
+        if not run_probe:
+            # The caller's request is the probe
+            return True
+        threading.Thread(target=self._run_probe, name="hlg-llm-probe", daemon=True).start()
+        return False
+
+    def _run_probe(self) -> None:
+        probe = self.probe
+        if probe is None:
+            return
+        start = self.clock()
+        try:
+            probe()
+        except Exception as e:
+            self.record_failure(f"probe failed: {e}")
+        else:
+            self.record_success(self.clock() - start)
+
+    def record_success(self, latency: float) -> None:
+        """Report a completed request and how long it took (seconds)"""
+        if latency > self.latency_threshold:
+            self.record_failure(f"slow response ({latency:.1f}s)")
+            return
+        with self._lock:
+            self.last_latency = latency
+            self.consecutive_failures = 0
+            change = self._transition(CLOSED, f"LLM responding ({latency:.1f}s)")
+        self._announce(change)
+
+    def record_failure(self, reason: str = "request failed") -> None:
+        """Report a failed (or too slow) request"""
+        change = None
+        with self._lock:
+            self.consecutive_failures += 1
+            if self.state == HALF_OPEN:
+                change = self._transition(OPEN, reason)
+            elif self.state == CLOSED and self.consecutive_failures >= self.failure_threshold:
+                change = self._transition(
+                    OPEN, f"{self.consecutive_failures} consecutive failures, last: {reason}"
+                )
+        self._announce(change)
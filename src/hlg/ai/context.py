@@ -0,0 +1,189 @@
+"""Rolling per-IP/per-user history used as LLM context"""
+
+import threading
+from collections import Counter, OrderedDict, deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional
+
+from ..parsers import AuthLogEvent
+
+_BUCKET_SECONDS = 300  # 5-minute buckets
+_WINDOW_BUCKETS = 24 * 3600 // _BUCKET_SECONDS  # 24h of history
+_HOUR_BUCKETS = 3600 // _BUCKET_SECONDS
+_MAX_RELATED = 64  # distinct usernames per IP / IPs per user kept
+_MAX_LABEL = 40  # usernames are attacker-controlled; keep them from eating the budget
+
+
+@dataclass
+class _Aggregate:
+    """Rolling counters for one IP or username"""
+
+    first_seen: datetime
+    buckets: deque = field(default_factory=deque)  # [bucket index, count], oldest first
+    event_types: Counter = field(default_factory=Counter)
+    related: set = field(default_factory=set)
+    verdicts: deque = field(default_factory=lambda: deque(maxlen=3))
+    threats: int = 0
+
+    def add(self, bucket: int, event_type: str, related: Optional[str]) -> None:
+        self.event_types[event_type] += 1
+        if self.buckets and self.buckets[-1][0] == bucket:
+            self.buckets[-1][1] += 1
+        else:
+            self.buckets.append([bucket, 1])
+        while self.buckets and self.buckets[0][0] <= bucket - _WINDOW_BUCKETS:
+            self.buckets.popleft()
+        if related and len(self.related) < _MAX_RELATED:
+            self.related.add(related)
+
+    def count_since(self, bucket: int) -> int:
+        return sum(count for index, count in self.buckets if index >= bucket)
+
+
+def _estimate_tokens(text: str) -> int:
+    """Rough token estimate (~4 characters per token for English/log text)"""
+    return (len(text) + 3) // 4
+
+
+class HistoryTracker:
+    """
+    In-memory rolling aggregates per source IP and username
+
+    Every event is recorded in O(1); summary() turns the aggregates for one
+    event into a few compact lines that fit a token budget, so the prompt
+    size stays bounded no matter how long an attack has been running.
+    """
+
+    def __init__(self, max_keys: int = 10000, token_budget: int = 120):
+        self.max_keys = max_keys
+        self.token_budget = token_budget
+        self._by_ip: "OrderedDict[str, _Aggregate]" = OrderedDict()
+        self._by_user: "OrderedDict[str, _Aggregate]" = OrderedDict()
+        # Ingestion records while the analyzer thread adds verdicts
+        self._lock = threading.Lock()
+
+    def _aggregate(
+        self, table: "OrderedDict[str, _Aggregate]", key: str, seen: datetime
+    ) -> _Aggregate:
+        aggregate = table.get(key)
+        if aggregate is None:
+            aggregate = table[key] = _Aggregate(first_seen=seen)
+            if len(table) > self.max_keys:
+                # Forget the least recently active key
+                table.popitem(last=False)
+        else:
+            table.move_to_end(key)
+        return aggregate
+
+    def record(self, event: AuthLogEvent) -> None:
+        """Add an event to the rolling aggregates"""
+        bucket = int(event.timestamp.timestamp()) // _BUCKET_SECONDS
+        with self._lock:
+            self._record(event, bucket)
+
+    def _record(self, event: AuthLogEvent, bucket: int) -> None:
+        if event.source_ip:
+            self._aggregate(self._by_ip, event.source_ip, event.timestamp).add(
+                bucket, event.event_type, event.username
+            )
+        if event.username:
+            self._aggregate(self._by_user, event.username, event.timestamp).add(
+                bucket, event.event_type, event.source_ip
+            )
+
+    def record_verdict(self, event: AuthLogEvent, severity: str, is_threat: bool) -> None:
+        """Remember the analyzer verdict for the event's IP and user"""
+        with self._lock:
+            self._record_verdict(event, severity, is_threat)
+
+    def _record_verdict(self, event: AuthLogEvent, severity: str, is_threat: bool) -> None:
+        for table, key in ((self._by_ip, event.source_ip), (self._by_user, event.username)):
+            aggregate = table.get(key) if key else None
+            if aggregate is not None:
+                aggregate.verdicts.append(severity)
+                aggregate.threats += int(is_threat)
+
+    def recent_count(self, event: AuthLogEvent) -> int:
+        """Prior events from the event's source IP in the last hour"""
+        if not event.source_ip:
+            return 0
+        bucket = int(event.timestamp.timestamp()) // _BUCKET_SECONDS
+        with self._lock:
+            aggregate = self._by_ip.get(event.source_ip)
+            return aggregate.count_since(bucket - _HOUR_BUCKETS + 1) if aggregate else 0
+
+    def _describe(self, label: str, aggregate: _Aggregate, bucket: int, related: str) -> list[str]:
+        """Summary parts for one aggregate, most important first"""
+        last_hour = aggregate.count_since(bucket - _HOUR_BUCKETS + 1)
+        last_day = aggregate.count_since(bucket - _WINDOW_BUCKETS + 1)
+        parts = [
+            f"{label}: {last_hour} prior events in 1h, {last_day} in 24h",
+            f"first seen {aggregate.first_seen.strftime('%Y-%m-%d %H:%M')}",
+        ]
+        if aggregate.verdicts:
+            parts.append(
+                f"prior verdicts {', '.join(aggregate.verdicts)} ({aggregate.threats} threats)"
+            )
+        if aggregate.related:
+            parts.append(f"{len(aggregate.related)} distinct {related}")
+        top = ", ".join(f"{name} {count}" for name, count in aggregate.event_types.most_common(3))
+        parts.append(f"types: {top}")
+        return parts
+
+    def _sections(self, event: AuthLogEvent, bucket: int) -> list[list[str]]:
+        """Summary parts for the event's IP and user, if seen before"""
+        sections = []
+        ip, username = event.source_ip, event.username
+        ip_aggregate = self._by_ip.get(ip) if ip else None
+        if ip and ip_aggregate:
+            sections.append(
+                self._describe(f"IP {ip[:_MAX_LABEL]}", ip_aggregate, bucket, "usernames tried")
+            )
+        user_aggregate = self._by_user.get(username) if username else None
+        if username and user_aggregate:
+            sections.append(
+                self._describe(
+                    f"User {username[:_MAX_LABEL]}", user_aggregate, bucket, "source IPs"
+                )
+            )
+        return sections
+
+    def summary(self, event: AuthLogEvent, token_budget: Optional[int] = None) -> Optional[str]:
+        """
+        Compact history for the event's source IP and username
+
+        Call before record() so the counts describe prior activity only.
+
+        Args:
+            event: Event about to be analyzed
+            token_budget: Override the tracker's token budget
+
+        Returns:
+            A short multi-line summary, or None if neither IP nor user was seen before
+        """
+        budget = token_budget or self.token_budget
+        bucket = int(event.timestamp.timestamp()) // _BUCKET_SECONDS
+
+        with self._lock:
+            sections = self._sections(event, bucket)
+        if not sections:
+            return None
+
+        # Take parts breadth-first (headline counts first) until the budget is used up
+        ordered = sorted(
+            (depth, index, part)
+            for index, parts in enumerate(sections)
+            for depth, part in enumerate(parts)
+        )
+        lines: list[list[str]] = [[] for _ in sections]
+        used = 0
+        for _, index, part in ordered:
+            cost = _estimate_tokens(part) + 1
+            if used + cost > budget:
+                break
+            lines[index].append(part)
+            used += cost
+
+        text = "\n".join("; ".join(line) for line in lines if line)
+        return text or None
@@ -1,11 +1,23 @@
 """CLI interface using Click"""
 
+from datetime import datetime, timedelta
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
 
-from .agent import HomeLabGuardian
-from .config import Settings
+if TYPE_CHECKING:
+    from .config import Settings
+
+# Heavy modules (pydantic, LangChain, requests) are imported inside the commands
+# that need them, so `hlg --version` and `hlg config` start quickly.
+
+
+def _load_settings() -> "Settings":
+    """Load settings from the environment / .env"""
+    from .config import Settings
+
+    return Settings()
 
 
 @click.group()
@@ -16,6 +28,11 @@ def cli():
 
 
 @cli.command()
+@click.option(
+    "--source",
+    type=click.Choice(["file", "journal"]),
+    help="Event source: a log file or the systemd journal (default: file)",
+)
 @click.option(
     "--log-path",
     type=click.Path(exists=True),
@@ -25,11 +42,16 @@ def cli():
 @click.option("--poll-interval", type=int, help="Polling interval in seconds (default: 1)")
 @click.option("--discord-webhook", type=str, help="Discord webhook URL")
 @click.option("--slack-webhook", type=str, help="Slack webhook URL")
-def run(log_path, model, poll_interval, discord_webhook, slack_webhook):
+@click.option("--journal-cursor-file", type=str, help="File used to persist the journal cursor")
+def run(
+    source, log_path, model, poll_interval, discord_webhook, slack_webhook, journal_cursor_file
+):
     """Start the Home Lab Guardian agent"""
     # Load settings from env, then override with CLI args
-    settings = Settings()
+    settings = _load_settings()
 
+    if source:
+        settings.log_source = source
     if log_path:
         settings.log_path = log_path
     if model:
@@ -40,9 +62,11 @@ def run(log_path, model, poll_interval, discord_webhook, slack_webhook):
         settings.discord_webhook_url = discord_webhook
     if slack_webhook:
         settings.slack_webhook_url = slack_webhook
+    if journal_cursor_file:
+        settings.journal_cursor_file = journal_cursor_file
 
     # Validate log path exists
-    if not Path(settings.log_path).exists():
+    if settings.log_source == "file" and not Path(settings.log_path).exists():
         click.echo(f"❌ Error: Log file not found: {settings.log_path}", err=True)
         click.echo("\n💡 Tip: Use --log-path to specify a different file", err=True)
         raise click.Abort()
@@ -53,7 +77,44 @@ def run(log_path, model, poll_interval, discord_webhook, slack_webhook):
         click.echo("💡 Set DISCORD_WEBHOOK_URL or SLACK_WEBHOOK_URL in .env")
         click.echo()
 
-    # Start the agent
+    # Start the agent (imported here: it loads the LLM stack)
+    from .agent import HomeLabGuardian
+
+    agent = HomeLabGuardian(settings)
+    agent.start()
+
+
+@cli.command()
+@click.option("--bind", type=str, help="Address to listen on (default: 0.0.0.0)")
+@click.option("--udp-port", type=int, help="Syslog UDP port, 0 to disable (default: 5514)")
+@click.option("--tcp-port", type=int, help="Syslog TCP port, 0 to disable (default: 5514)")
+@click.option("--model", type=str, help="Ollama model to use (default: llama3.1:8b)")
+@click.option("--discord-webhook", type=str, help="Discord webhook URL")
+@click.option("--slack-webhook", type=str, help="Slack webhook URL")
+def collector(bind, udp_port, tcp_port, model, discord_webhook, slack_webhook):
+    """Collect auth logs from remote hosts over syslog (UDP/TCP)"""
+    settings = _load_settings()
+    settings.log_source = "syslog"
+
+    if bind:
+        settings.collector_bind = bind
+    if udp_port is not None:
+        settings.collector_udp_port = udp_port
+    if tcp_port is not None:
+        settings.collector_tcp_port = tcp_port
+    if model:
+        settings.ollama_model = model
+    if discord_webhook:
+        settings.discord_webhook_url = discord_webhook
+    if slack_webhook:
+        settings.slack_webhook_url = slack_webhook
+
+    if not settings.collector_udp_port and not settings.collector_tcp_port:
+        click.echo("❌ Error: Both UDP and TCP listeners are disabled", err=True)
+        raise click.Abort()
+
+    from .agent import HomeLabGuardian
+
     agent = HomeLabGuardian(settings)
     agent.start()
 
@@ -61,8 +122,6 @@ def run(log_path, model, poll_interval, discord_webhook, slack_webhook):
 @cli.command()
 def test():
     """Test AI analyzer with a sample event"""
-    from datetime import datetime
-
     from .ai import ThreatAnalyzer
     from .parsers import AuthLogEvent
 
@@ -80,7 +139,7 @@ def test():
         severity="high",
     )
 
-    settings = Settings()
+    settings = _load_settings()
     analyzer = ThreatAnalyzer(base_url=settings.ollama_base_url, model=settings.ollama_model)
 
     click.echo(f"📊 Analyzing sample event: {event.event_type}")
@@ -100,11 +159,15 @@ def test():
 @cli.command()
 def config():
     """Show current configuration"""
-    settings = Settings()
+    settings = _load_settings()
 
     click.echo("⚙️  Current Configuration:")
     click.echo("=" * 50)
+    click.echo(f"Log Source:       {settings.log_source}")
     click.echo(f"Log Path:         {settings.log_path}")
+    if settings.log_source == "journal":
+        click.echo(f"Journal Matches:  {', '.join(settings.journal_matches)}")
+        click.echo(f"Journal Cursor:   {settings.journal_cursor_file}")
     click.echo(f"Poll Interval:    {settings.poll_interval}s")
     click.echo(f"Ollama URL:       {settings.ollama_base_url}")
     click.echo(f"Ollama Model:     {settings.ollama_model}")
@@ -115,6 +178,83 @@ def config():
     click.echo(f"Alert on Failed:  {settings.alert_on_failed_login}")
     click.echo(f"Alert on Sudo:    {settings.alert_on_sudo}")
     click.echo(f"Min Severity:     {settings.min_severity}")
+    click.echo(f"Event Store:      {settings.store_path or '✗ Disabled'}")
+    click.echo(f"Retention:        {settings.store_retention_days} days")
+
+
+def _parse_since(value: str) -> datetime:
+    """Parse a relative duration such as 30m, 24h or 7d into a start time"""
+    units = {"s": "seconds", "m": "minutes", "h": "hours", "d": "days"}
+    try:
+        amount, unit = int(value[:-1]), units[value[-1]]
+    except (ValueError, KeyError, IndexError):
+        raise click.BadParameter(f"expected e.g. 30m, 24h or 7d, got {value!r}")
+    return datetime.now() - timedelta(**{unit: amount})
+
+
+@cli.command()
+@click.option("--ip", "source_ip", type=str, help="Filter by source IP")
+@click.option("--user", "username", type=str, help="Filter by username")
+@click.option("--type", "event_type", type=str, help="Filter by event type (e.g. failed_login)")
+@click.option("--since", type=str, help="Only events newer than this (e.g. 30m, 24h, 7d)")
+@click.option("--limit", type=int, default=50, show_default=True, help="Maximum events to show")
+@click.option("--count", is_flag=True, help="Only print the number of matching events")
+@click.option("--store", "store_path", type=str, help="Path to the event store")
+def query(source_ip, username, event_type, since, limit, count, store_path):
+    """Query the recorded event history"""
+    from .store import EventStore
+
+    settings = _load_settings()
+    path = store_path or settings.store_path
+    if not path or not Path(path).exists():
+        click.echo(f"❌ Error: Event store not found: {path}", err=True)
+        raise click.Abort()
+
+    store = EventStore(path, retention_days=settings.store_retention_days)
+    try:
+        filters = dict(
+            source_ip=source_ip,
+            username=username,
+            event_type=event_type,
+            since=_parse_since(since) if since else None,
+        )
+        if count:
+            click.echo(store.count(**filters))
+            return
+
+        for stored in store.query(limit=limit, **filters):
+            event = stored.event
+            verdict = ""
+            if stored.verdict:
+                verdict = stored.verdict.upper() + (" (threat)" if stored.is_threat else "")
+            click.echo(
+                f"{event.timestamp.strftime('%Y-%m-%d %H:%M:%S')}  {event.hostname:<12} "
+                f"{event.event_type:<18} {event.username or '-':<12} {event.source_ip or '-':<16} "
+                f"{event.severity:<6} {verdict}".rstrip()
+            )
+    finally:
+        store.close()
+
+
+@cli.command()
+@click.option("--retention-days", type=int, help="Override the configured retention period")
+@click.option("--store", "store_path", type=str, help="Path to the event store")
+def compact(retention_days, store_path):
+    """Drop expired events and reclaim space in the event store"""
+    from .store import EventStore
+
+    settings = _load_settings()
+    path = store_path or settings.store_path
+    if not path or not Path(path).exists():
+        click.echo(f"❌ Error: Event store not found: {path}", err=True)
+        raise click.Abort()
+
+    store = EventStore(path, retention_days=settings.store_retention_days)
+    try:
+        removed = store.compact(retention_days)
+    finally:
+        store.close()
+    click.echo(f"🧹 Removed {removed} expired events")
 
 
 def main():
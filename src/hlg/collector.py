@@ -0,0 +1,254 @@
+"""Remote syslog collector (RFC 3164 / RFC 5424 over UDP and TCP)"""
+
+import asyncio
+import queue
+import re
+import threading
+from collections import Counter, defaultdict
+from datetime import datetime
+from typing import Any, Callable, Generator, Iterable, Optional
+
+from .parsers import AuthLogEvent, AuthLogParser
+
+# Syslog facilities carrying authentication messages: auth (4) and authpriv (10)
+AUTH_FACILITIES = frozenset({4, 10})
+
+_PRI_RE = re.compile(r"^<(\d{1,3})>")
+# VERSION TIMESTAMP HOSTNAME APP-NAME PROCID MSGID STRUCTURED-DATA [MSG]
+_RFC5424_RE = re.compile(r"^\d{1,2} (\S+) (\S+) (\S+) \S+ \S+ (?:-|(?:\[.*?\])+)(?: (.*))?$", re.S)
+
+
+def parse_syslog_message(
+    raw: str, parser: AuthLogParser, facilities: Optional[Iterable[int]] = AUTH_FACILITIES
+) -> Optional[AuthLogEvent]:
+    """
+    Parse one syslog message in RFC 5424 or RFC 3164 (BSD) format
+
+    Args:
+        raw: Message as received, including the <PRI> prefix
+        parser: Parser used to classify the message
+        facilities: Facilities to accept (None accepts everything)
+
+    Returns:
+        The parsed event, or None if the message is malformed or filtered out
+    """
+    pri = _PRI_RE.match(raw)
+    if pri:
+        if facilities is not None and int(pri.group(1)) >> 3 not in facilities:
+            return None
+        raw = raw[pri.end() :]
+
+    rfc5424 = _RFC5424_RE.match(raw)
+    if not rfc5424:
+        # RFC 3164 is the same layout as auth.log
+        return parser.parse(raw.rstrip("\r\n"))
+
+    timestamp_str, hostname, app_name, message = rfc5424.groups()
+    if not message:
+        return None
+    try:
+        timestamp = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
+        timestamp = timestamp.astimezone().replace(tzinfo=None)
+    except ValueError:
+        timestamp = datetime.now()
+    return parser.parse_message(
+        timestamp, hostname, app_name, message.lstrip("\ufeff").rstrip("\r\n")
+    )
+
+
+class _UDPProtocol(asyncio.DatagramProtocol):
+    def __init__(self, collector: "SyslogCollector"):
+        self.collector = collector
+
+    def datagram_received(self, data: bytes, addr: tuple[Any, ...]) -> None:
+        for raw in data.decode("utf-8", errors="replace").splitlines():
+            if raw:
+                self.collector.submit(addr[0], raw)
+
+
+class SyslogCollector:
+    """
+    Receive auth logs from many hosts over UDP and TCP syslog
+
+    Messages are buffered per sending host and parsed in batches; parsed
+    events from every host land in one queue that feeds the shared analysis
+    pipeline. The asyncio server runs in a background thread so the
+    (synchronous) analyzer can consume events from the main thread.
+    """
+
+    def __init__(
+        self,
+        parser: Optional[AuthLogParser] = None,
+        bind: str = "0.0.0.0",
+        udp_port: Optional[int] = 5514,
+        tcp_port: Optional[int] = 5514,
+        batch_size: int = 256,
+        flush_interval: float = 0.1,
+        max_pending: int = 10000,
+        facilities: Optional[Iterable[int]] = AUTH_FACILITIES,
+    ):
+        self.parser = parser or AuthLogParser()
+        self.bind = bind
+        self.udp_port = udp_port
+        self.tcp_port = tcp_port
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.facilities = frozenset(facilities) if facilities is not None else None
+
+        self.events: "queue.Queue[AuthLogEvent]" = queue.Queue(maxsize=max_pending)
+        self.received: Counter = Counter()  # messages per sending host
+        self.dropped = 0
+
+        self._buffers: dict[str, list[str]] = defaultdict(list)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._ready = threading.Event()
+        self._stopping: Optional[asyncio.Event] = None
+        self._error: Optional[BaseException] = None
+        self._connections: set[asyncio.StreamWriter] = set()
+
+    # Batching
+
+    def submit(self, host: str, raw: str) -> None:
+        """Buffer a raw message from ``host``; parses the host's batch once it is full"""
+        self.received[host] += 1
+        buffer = self._buffers[host]
+        buffer.append(raw)
+        if len(buffer) >= self.batch_size:
+            self._flush_host(host)
+
+    def _flush_host(self, host: str) -> None:
+        batch = self._buffers.pop(host, None)
+        if not batch:
+            return
+        for raw in batch:
+            event = parse_syslog_message(raw, self.parser, self.facilities)
+            if event is None:
+                continue
+            try:
+                self.events.put_nowait(event)
+            except queue.Full:
+                self.dropped += 1
+
+    def flush(self) -> None:
+        """Parse everything buffered so far"""
+        for host in list(self._buffers):
+            self._flush_host(host)
+
+    # Server
+
+    async def _handle_tcp(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        host = writer.get_extra_info("peername")[0]
+        self._connections.add(writer)
+        try:
+            while True:
+                first = await reader.read(1)
+                if not first:
+                    break
+                if first.isdigit():
+                    # Octet counting (RFC 6587): "<length> <message>"
+                    length = first + await reader.readuntil(b" ")
+                    data = await reader.readexactly(int(length[:-1]))
+                else:
+                    # Non-transparent framing: newline-terminated
+                    data = first + await reader.readline()
+                raw = data.decode("utf-8", errors="replace").rstrip("\r\n")
+                if raw:
+                    self.submit(host, raw)
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ValueError):
+            pass
+        finally:
+            self._connections.discard(writer)
+            writer.close()
+
+    async def serve(self) -> None:
+        """Run the UDP/TCP listeners until stop() is called"""
+        loop = asyncio.get_running_loop()
+        self._stopping = asyncio.Event()
+        transport = server = None
+        try:
+            if self.udp_port is not None:
+                transport, _ = await loop.create_datagram_endpoint(
+                    lambda: _UDPProtocol(self), local_addr=(self.bind, self.udp_port)
+                )
+                self.udp_port = transport.get_extra_info("sockname")[1]
+            if self.tcp_port is not None:
+                server = await asyncio.start_server(self._handle_tcp, self.bind, self.tcp_port)
+                self.tcp_port = server.sockets[0].getsockname()[1]
+        except OSError as e:
+            self._error = e
+            self._ready.set()
+            raise
+        self._ready.set()
+
+        try:
+            while not self._stopping.is_set():
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), self.flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+                self.flush()
+        finally:
+            if transport:
+                transport.close()
+            if server:
+                server.close()
+                for writer in list(self._connections):
+                    writer.close()
+                await server.wait_closed()
+            self.flush()
+
+    def start(self) -> None:
+        """Start the server in a background thread and wait until it is listening"""
+
+        def run() -> None:
+            self._loop = asyncio.new_event_loop()
+            try:
+                self._loop.run_until_complete(self.serve())
+            except OSError:
+                pass
+            finally:
+                self._loop.close()
+
+        self._thread = threading.Thread(target=run, name="hlg-collector", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        if self._error:
+            raise self._error
+
+    def stop(self) -> None:
+        """Stop the server and wait for the background thread"""
+        if self._loop and self._stopping and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._stopping.set)
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+
+def watch_syslog(
+    collector: SyslogCollector,
+    poll_interval: float = 1.0,
+    keep_running: Callable[[], bool] = lambda: True,
+) -> Generator[AuthLogEvent, None, None]:
+    """
+    Run a collector and yield events from all hosts as they are parsed
+
+    Args:
+        collector: Configured (not yet started) collector
+        poll_interval: How often to check ``keep_running`` while no events arrive (seconds)
+        keep_running: Returns False once the caller wants to shut down
+
+    Yields:
+        Parsed events, in arrival order per host
+    """
+    collector.start()
+    try:
+        # Wake up periodically so a quiet collector still notices shutdown
+        while keep_running():
+            try:
+                event = collector.events.get(timeout=poll_interval)
+            except queue.Empty:
+                continue
+            yield event
+    finally:
+        collector.stop()
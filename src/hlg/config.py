@@ -1,6 +1,6 @@
 """Configuration management using Pydantic Settings"""
 
-from typing import Optional
+from typing import Any, Optional
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -12,14 +12,48 @@ class Settings(BaseSettings):
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore")
 
     # Log monitoring
+    log_source: str = Field(
+        default="file", description="Event source: 'file', 'journal' or 'syslog' (collector)"
+    )
     log_path: str = Field(default="/var/log/auth.log", description="Path to log file to monitor")
     poll_interval: int = Field(default=1, description="Polling interval in seconds")
 
+    # journald source
+    journal_matches: list[str] = Field(
+        default_factory=lambda: [
+            "_SYSTEMD_UNIT=ssh.service",
+            "_SYSTEMD_UNIT=sshd.service",
+            "SYSLOG_IDENTIFIER=sudo",
+        ],
+        description="journalctl-style FIELD=value matches applied at the source",
+    )
+    journal_cursor_file: Optional[str] = Field(
+        default="/var/lib/hlg/journal.cursor",
+        description="File used to persist the journal cursor for resume",
+    )
+
+    # Remote syslog collector
+    collector_bind: str = Field(default="0.0.0.0", description="Address the collector listens on")
+    collector_udp_port: int = Field(default=5514, description="Syslog UDP port (0 to disable)")
+    collector_tcp_port: int = Field(default=5514, description="Syslog TCP port (0 to disable)")
+
     # Ollama configuration
     ollama_base_url: str = Field(
         default="http://localhost:11434", description="Ollama API base URL"
     )
     ollama_model: str = Field(default="llama3.1:8b", description="Ollama model to use")
+    llm_timeout: float = Field(default=30.0, description="Seconds before an LLM request fails")
+
+    # LLM circuit breaker
+    breaker_failure_threshold: int = Field(
+        default=3, description="Consecutive LLM failures before switching to rule-only mode"
+    )
+    breaker_latency_threshold: float = Field(
+        default=20.0, description="LLM responses slower than this (seconds) count as failures"
+    )
+    breaker_reset_timeout: float = Field(
+        default=60.0, description="Seconds in rule-only mode before probing the LLM again"
+    )
 
     # Notification settings
     discord_webhook_url: Optional[str] = Field(default=None, description="Discord webhook URL")
@@ -28,7 +62,33 @@ class Settings(BaseSettings):
     # Alert configuration
     alert_on_failed_login: bool = Field(default=True, description="Alert on failed login attempts")
     alert_on_sudo: bool = Field(default=True, description="Alert on sudo usage")
-    min_severity: str = Field(default="medium", description="Minimum severity to alert on")
+    min_severity: str = Field(
+        default="medium", description="Minimum parser severity for an event to be analyzed"
+    )
+
+    # Analysis queue
+    queue_max_size: int = Field(default=10000, description="Maximum events waiting for analysis")
+    priority_aging_per_minute: float = Field(
+        default=1.0, description="Priority (in severity levels) a waiting event gains per minute"
+    )
+
+    # Event history
+    store_path: Optional[str] = Field(
+        default="/var/lib/hlg/events.db", description="SQLite event store (empty to disable)"
+    )
+    store_retention_days: int = Field(default=30, description="Days of event history to keep")
+
+    # LLM context
+    context_token_budget: int = Field(
+        default=120, description="Approximate token budget for the history summary in prompts"
+    )
+
+    # Parser configuration
+    auth_patterns: list[dict[str, Any]] = Field(
+        default_factory=list,
+        description="Extra auth.log patterns (JSON list of AuthPattern fields), tried before the "
+        "built-in table",
+    )
 
 
 def get_settings() -> Settings:
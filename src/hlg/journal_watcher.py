@@ -0,0 +1,282 @@
+"""systemd-journald event source"""
+
+import os
+import struct
+from datetime import datetime
+from pathlib import Path
+from typing import BinaryIO, Generator, Iterable, Iterator, Optional, Union
+
+from .parsers import AuthLogEvent, AuthLogParser
+
+DEFAULT_JOURNAL_MATCHES = [
+    "_SYSTEMD_UNIT=ssh.service",
+    "_SYSTEMD_UNIT=sshd.service",
+    "SYSLOG_IDENTIFIER=sudo",
+]
+
+# Fields kept from each exported entry; everything else is skipped while reading
+JOURNAL_FIELDS = (
+    "__CURSOR",
+    "__REALTIME_TIMESTAMP",
+    "_HOSTNAME",
+    "SYSLOG_IDENTIFIER",
+    "_COMM",
+    "MESSAGE",
+)
+
+
+class JournalCursor:
+    """Persist the journal cursor of the last processed entry"""
+
+    def __init__(self, path: Optional[str]):
+        self.path = Path(path) if path else None
+        self._warned = False
+
+    def _warn(self, error: OSError) -> None:
+        """Report an unusable cursor file once; ingestion carries on without resume"""
+        if not self._warned:
+            print(f"⚠️  Journal cursor not persisted ({self.path}): {error}")
+            self._warned = True
+
+    def load(self) -> Optional[str]:
+        """Return the stored cursor, if any"""
+        if not self.path or not self.path.exists():
+            return None
+        try:
+            cursor = self.path.read_text().strip()
+        except OSError as e:
+            self._warn(e)
+            return None
+        return cursor or None
+
+    def save(self, cursor: str) -> None:
+        """Atomically store the cursor"""
+        if not self.path:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(self.path.name + ".tmp")
+            tmp_path.write_text(cursor)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            self._warn(e)
+
+
+def group_matches(matches: Iterable[str]) -> dict[str, set[str]]:
+    """Group journalctl-style "FIELD=value" matches by field"""
+    grouped: dict[str, set[str]] = {}
+    for match in matches:
+        field, _, value = match.partition("=")
+        grouped.setdefault(field, set()).add(value)
+    return grouped
+
+
+def entry_matches(entry: dict, grouped: dict[str, set[str]]) -> bool:
+    """
+    Check an entry against matches grouped by group_matches()
+
+    Like journald, any of the matches may apply (they are combined with OR).
+    An empty match list accepts every entry.
+    """
+    if not grouped:
+        return True
+    return any(entry.get(field) in values for field, values in grouped.items())
+
+
+def _cursor_position(cursor: str) -> Optional[tuple[str, int]]:
+    """Extract (seqnum_id, seqnum) from a journal cursor string"""
+    parts = dict(part.split("=", 1) for part in cursor.split(";") if "=" in part)
+    try:
+        return parts["s"], int(parts["i"], 16)
+    except (KeyError, ValueError):
+        return None
+
+
+def is_after_cursor(cursor: str, stored: Optional[str]) -> bool:
+    """Return True if ``cursor`` points past the ``stored`` cursor"""
+    if not stored:
+        return True
+    position, stored_position = _cursor_position(cursor), _cursor_position(stored)
+    if not position or not stored_position or position[0] != stored_position[0]:
+        # Different journal file sequence (e.g. after a vacuum) - nothing to compare
+        return cursor != stored
+    return position[1] > stored_position[1]
+
+
+def journal_entry_to_event(entry: dict, parser: AuthLogParser) -> Optional[AuthLogEvent]:
+    """
+    Convert a journal entry into an AuthLogEvent
+
+    Timestamp, hostname and service come from the entry's fields, so the
+    syslog header regex and timestamp parsing are skipped entirely.
+    """
+    message = entry.get("MESSAGE")
+    if not message:
+        return None
+    if isinstance(message, bytes):
+        message = message.decode("utf-8", errors="replace")
+
+    timestamp = entry.get("__REALTIME_TIMESTAMP")
+    if not isinstance(timestamp, datetime):
+        # Export files carry microseconds since the epoch
+        timestamp = (
+            datetime.fromtimestamp(int(timestamp) / 1_000_000) if timestamp else datetime.now()
+        )
+
+    service = entry.get("SYSLOG_IDENTIFIER") or entry.get("_COMM") or "unknown"
+    hostname = entry.get("_HOSTNAME") or "localhost"
+    return parser.parse_message(timestamp, hostname, service, message)
+
+
+def read_journal_export(
+    source: Union[str, BinaryIO], fields: Iterable[str] = JOURNAL_FIELDS
+) -> Iterator[dict[str, Union[str, bytes]]]:
+    """
+    Read entries from a journal export file (``journalctl -o export``)
+
+    Text fields are decoded as UTF-8; binary fields are returned as bytes.
+
+    Args:
+        source: Path to the export file or an open binary file
+        fields: Fields to keep; everything else is skipped
+
+    Yields:
+        One dict of fields per journal entry
+    """
+    keep = frozenset(fields)
+    handle = open(source, "rb") if isinstance(source, str) else source
+    try:
+        entry: dict[str, Union[str, bytes]] = {}
+        while True:
+            line = handle.readline()
+            if not line or line == b"\n":
+                if entry:
+                    yield entry
+                    entry = {}
+                if not line:
+                    break
+                continue
+
+            line = line.rstrip(b"\n")
+            if b"=" in line:
+                field, _, raw = line.partition(b"=")
+                value: Union[str, bytes] = raw.decode("utf-8", errors="replace")
+            else:
+                # Binary-safe field: name, little-endian 64-bit size, data, newline
+                field = line
+                (size,) = struct.unpack("<Q", handle.read(8))
+                value = handle.read(size)
+                handle.read(1)
+
+            name = field.decode("ascii", errors="replace")
+            if name in keep:
+                entry[name] = value
+    finally:
+        if isinstance(source, str):
+            handle.close()
+
+
+def read_journal_export_events(
+    path: str,
+    matches: Iterable[str] = DEFAULT_JOURNAL_MATCHES,
+    cursor_file: Optional[str] = None,
+    parser: Optional[AuthLogParser] = None,
+) -> Generator[AuthLogEvent, None, None]:
+    """
+    Read auth events from a journal export file, resuming after the stored cursor
+
+    Args:
+        path: Path to the export file
+        matches: journalctl-style "FIELD=value" matches
+        cursor_file: File used to persist the cursor of the last entry read
+        parser: Parser used to classify messages
+
+    Yields:
+        Parsed events for matching entries
+    """
+    parser = parser or AuthLogParser()
+    grouped = group_matches(matches)
+    cursor = JournalCursor(cursor_file)
+    stored = cursor.load()
+    last = None
+
+    try:
+        # Keep the matched fields too, or entry_matches() would never see them
+        for entry in read_journal_export(path, set(JOURNAL_FIELDS) | set(grouped)):
+            entry_cursor = entry.get("__CURSOR")
+            if isinstance(entry_cursor, str):
+                if not is_after_cursor(entry_cursor, stored):
+                    continue
+                last = entry_cursor
+
+            if not entry_matches(entry, grouped):
+                continue
+            event = journal_entry_to_event(entry, parser)
+            if event:
+                yield event
+    finally:
+        if last:
+            cursor.save(last)
+
+
+def watch_journal(
+    matches: Iterable[str] = DEFAULT_JOURNAL_MATCHES,
+    cursor_file: Optional[str] = None,
+    poll_interval: int = 1,
+    parser: Optional[AuthLogParser] = None,
+) -> Generator[AuthLogEvent, None, None]:
+    """
+    Follow the systemd journal and yield auth events as they appear
+
+    Matches are applied by journald itself, so non-auth entries are never
+    read. Requires the optional ``systemd-python`` package.
+
+    Args:
+        matches: journalctl-style "FIELD=value" matches (combined with OR)
+        cursor_file: File used to persist the cursor for resume across restarts
+        poll_interval: How long to wait for new entries (seconds)
+        parser: Parser used to classify messages
+
+    Yields:
+        Parsed events for matching entries
+    """
+    try:
+        from systemd import journal  # type: ignore[import-not-found]
+    except ImportError as e:
+        raise RuntimeError(
+            "Reading the journal requires systemd-python: pip install 'home-lab-guardian[journald]'"
+        ) from e
+
+    parser = parser or AuthLogParser()
+    cursor = JournalCursor(cursor_file)
+    reader = journal.Reader()
+
+    for i, match in enumerate(matches):
+        if i:
+            reader.add_disjunction()
+        reader.add_match(match)
+
+    stored = cursor.load()
+    if stored:
+        reader.seek_cursor(stored)
+        # seek_cursor positions on the stored entry itself, which was already processed
+        reader.get_next()
+    else:
+        reader.seek_tail()
+        reader.get_previous()
+
+    last = None
+    try:
+        while True:
+            for entry in reader:
+                last = entry.get("__CURSOR", last)
+                event = journal_entry_to_event(entry, parser)
+                if event:
+                    yield event
+            if last:
+                cursor.save(last)
+            reader.wait(poll_interval)
+    finally:
+        if last:
+            cursor.save(last)
+        reader.close()
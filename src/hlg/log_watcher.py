@@ -1,14 +1,11 @@
-"""Log file watcher using watchdog"""
+"""Log file tailer"""
 
 import time
 from pathlib import Path
 from typing import Generator
 
-from watchdog.events import FileSystemEvent, FileSystemEventHandler
-from watchdog.observers import Observer
 
-
-class LogTailer(FileSystemEventHandler):
+class LogTailer:
     """Tail a log file and yield new lines"""
 
     def __init__(self, log_path: str):
@@ -1,12 +1,12 @@
 """Slack webhook notifier"""
 
-from typing import Optional
+from typing import TYPE_CHECKING
 
-import requests
-
-from ..ai import ThreatAnalysis
 from ..parsers import AuthLogEvent
 
+if TYPE_CHECKING:
+    from ..ai import ThreatAnalysis
+
 
 class SlackNotifier:
     """Send notifications to Slack via webhook"""
@@ -14,7 +14,7 @@ class SlackNotifier:
     def __init__(self, webhook_url: str):
         self.webhook_url = webhook_url
 
-    def send_alert(self, event: AuthLogEvent, analysis: ThreatAnalysis) -> bool:
+    def send_alert(self, event: AuthLogEvent, analysis: "ThreatAnalysis") -> bool:
         """
         Send an alert to Slack
 
@@ -78,6 +78,34 @@ class SlackNotifier:
 
         payload = {"blocks": blocks}
 
+        return self._post(payload)
+
+    def send_status(self, title: str, message: str) -> bool:
+        """
+        Send an operational status message (not tied to a log event)
+
+        Args:
+            title: Short headline
+            message: Details
+
+        Returns:
+            True if notification was sent successfully
+        """
+        if not self.webhook_url:
+            return False
+
+        blocks = [
+            {"type": "header", "text": {"type": "plain_text", "text": f":gear: {title}"}},
+            {"type": "section", "text": {"type": "mrkdwn", "text": message}},
+        ]
+
+        return self._post({"blocks": blocks})
+
+    def _post(self, payload: dict) -> bool:
+        """POST a payload to the webhook"""
+        # Imported here so loading the notifiers doesn't pull in requests
+        import requests
+
         try:
             response = requests.post(self.webhook_url, json=payload, timeout=10)
             response.raise_for_status()
@@ -1,5 +1,17 @@
 """Parser initialization"""
 
-from .auth import AuthLogEvent, parse_auth_log_line
+from .auth import (
+    FAILED_LOGIN_EVENT_TYPES,
+    AuthLogEvent,
+    AuthLogParser,
+    AuthPattern,
+    parse_auth_log_line,
+)
 
-__all__ = ["AuthLogEvent", "parse_auth_log_line"]
+__all__ = [
+    "AuthLogEvent",
+    "AuthLogParser",
+    "AuthPattern",
+    "FAILED_LOGIN_EVENT_TYPES",
+    "parse_auth_log_line",
+]
@@ -2,8 +2,8 @@
 
 import re
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Optional
+from datetime import datetime, timedelta
+from typing import Iterable, Optional
 
 
 @dataclass
@@ -14,81 +14,297 @@ class AuthLogEvent:
     hostname: str
     service: str
     message: str
-    event_type: str  # "failed_login", "sudo", "session_opened", "unknown"
+    event_type: str  # "failed_login", "invalid_user", "sudo", "session_opened", ..., "unknown"
     username: Optional[str] = None
     source_ip: Optional[str] = None
     severity: str = "low"  # "low", "medium", "high"
 
 
-def parse_auth_log_line(line: str) -> Optional[AuthLogEvent]:
+# IPv4 dotted quad, or IPv6 (anything hex containing a colon, incl. IPv4-mapped and zone ids)
+IP_PATTERN = r"(?P<ip>\d{1,3}(?:\.\d{1,3}){3}|[0-9A-Fa-f]*:[0-9A-Fa-f:.]+(?:%\w+)?)"
+
+# Event types that represent someone trying (and failing) to get in
+FAILED_LOGIN_EVENT_TYPES = frozenset(
+    {"failed_login", "invalid_user", "max_auth_attempts", "break_in_attempt"}
+)
+
+_SSHD_SERVICES = ("sshd", "sshd-session")
+
+# Basic auth.log pattern: timestamp hostname service[pid]: message
+_LINE_RE = re.compile(
+    r"^(\w{3}\s+\d{1,2}\s+\d{2}:\d{2}:\d{2})\s+(\S+)\s+([\w.-]+)(?:\[\d+\])?: (.+)$"
+)
+
+# Tolerated clock skew before a year-less timestamp is taken to be from last year
+_FUTURE_SKEW = timedelta(days=1)
+
+# rsyslog duplicate suppression: "message repeated 3 times: [ Failed password ...]"
+_REPEATED_RE = re.compile(r"^message repeated \d+ times: \[\s*(.*?)\s*\]$")
+
+
+@dataclass(frozen=True)
+class AuthPattern:
+    """
+    One entry of the parser's pattern table
+
+    Attributes:
+        event_type: Event type assigned when the pattern matches
+        regex: Regular expression; the named groups ``user`` and ``ip`` are extracted
+        severity: Initial severity assigned to the event
+        services: Services the pattern applies to (empty means any service)
+        prefix: First word of the message. Patterns with a prefix are only tried
+            for messages starting with that word and are matched with ``re.match``;
+            patterns without one are tried on every message with ``re.search``
+        ignore_case: Compile the regex case-insensitively
+    """
+
+    event_type: str
+    regex: str
+    severity: str = "low"
+    services: tuple[str, ...] = ()
+    prefix: Optional[str] = None
+    ignore_case: bool = False
+
+    def __post_init__(self) -> None:
+        # Allow lists from JSON config
+        object.__setattr__(self, "services", tuple(self.services))
+
+
+# Order matters: the first matching pattern wins
+DEFAULT_PATTERNS: tuple[AuthPattern, ...] = (
+    AuthPattern(
+        event_type="failed_login",
+        # Hostname instead of an address with sshd UseDNS
+        regex=rf"Failed \S+ for (?:invalid user )?(?P<user>.*?) from (?:{IP_PATTERN}|\S+)(?:\s|$)",
+        severity="high",
+        prefix="Failed",
+    ),
+    AuthPattern(
+        event_type="invalid_user",
+        regex=rf"Invalid user (?P<user>.*?) from {IP_PATTERN}",
+        severity="high",
+        services=_SSHD_SERVICES,
+        prefix="Invalid",
+    ),
+    AuthPattern(
+        event_type="max_auth_attempts",
+        regex=(
+            r"error: maximum authentication attempts exceeded for (?:invalid user )?"
+            rf"(?P<user>.*?) from {IP_PATTERN}"
+        ),
+        severity="high",
+        services=_SSHD_SERVICES,
+        prefix="error:",
+    ),
+    AuthPattern(
+        event_type="max_auth_attempts",
+        regex=(
+            r"Disconnecting (?:authenticating|invalid) user (?P<user>.*?) "
+            rf"{IP_PATTERN} port \d+: Too many authentication failures"
+        ),
+        severity="high",
+        services=_SSHD_SERVICES,
+        prefix="Disconnecting",
+    ),
+    AuthPattern(
+        event_type="connection_closed",
+        regex=rf"Connection closed by (?:authenticating|invalid) user (?P<user>.*?) {IP_PATTERN}",
+        severity="medium",
+        services=_SSHD_SERVICES,
+        prefix="Connection",
+    ),
+    AuthPattern(
+        event_type="accepted_login",
+        regex=rf"Accepted \S+ for (?P<user>.*?) from {IP_PATTERN}",
+        severity="low",
+        services=_SSHD_SERVICES,
+        prefix="Accepted",
+    ),
+    AuthPattern(
+        event_type="break_in_attempt",
+        regex=rf"(?:\[|Address ){IP_PATTERN}\]?.*POSSIBLE BREAK-IN ATTEMPT",
+        severity="high",
+        services=_SSHD_SERVICES,
+    ),
+    AuthPattern(
+        event_type="failed_login",
+        # pam_unix, incl. "PAM 2 more authentication failures;"
+        regex=(r"authentication failures?;(?:.*?rhost=(?P<ip>\S*))?" r"(?:\s+user=(?P<user>\S+))?"),
+        severity="high",
+        ignore_case=True,
+    ),
+    AuthPattern(
+        event_type="failed_login",
+        regex=r"FAILED LOGIN \(\d+\) on '[^']*' FOR '(?P<user>[^']*)'",
+        severity="high",
+        services=("login",),
+        prefix="FAILED",
+    ),
+    AuthPattern(
+        event_type="failed_login",
+        regex=r"authentication failure",
+        severity="high",
+        ignore_case=True,
+    ),
+    AuthPattern(
+        event_type="sudo",
+        regex=r"^\s*(?:(?P<user>\S+)\s*:)?",
+        severity="medium",
+        services=("sudo",),
+    ),
+    AuthPattern(
+        event_type="session_opened",
+        regex=r"session opened for user (?P<user>[^\s(]+)",
+        severity="low",
+        ignore_case=True,
+    ),
+)
+
+
+def _syslog_timestamp(timestamp_str: str, now: Optional[datetime] = None) -> Optional[datetime]:
+    """
+    Parse a year-less syslog timestamp ("Nov 30 12:34:56")
+
+    auth.log doesn't record the year: assume the current one, unless that
+    puts the event in the future (e.g. December lines read in January).
+    """
+    now = now or datetime.now()
+    for year in (now.year, now.year - 1):
+        try:
+            timestamp = datetime.strptime(f"{year} {timestamp_str}", "%Y %b %d %H:%M:%S")
+        except ValueError:
+            continue  # malformed, or Feb 29 outside a leap year
+        if timestamp <= now + _FUTURE_SKEW:
+            return timestamp
+    return None
+
+
+_Candidates = list[tuple[re.Pattern, AuthPattern, bool]]  # (regex, pattern, anchored)
+_DispatchSlot = tuple[dict[str, _Candidates], _Candidates]  # (by first word, fallback)
+
+
+class AuthLogParser:
+    """
+    Table-driven auth.log parser
+
+    The pattern table is compiled once into a two-level dispatch: service name,
+    then the first word of the message. Each slot holds the ordered list of
+    patterns that can possibly apply, so a line is only tested against a handful
+    of regexes regardless of how large the table grows.
+    """
+
+    def __init__(self, extra_patterns: Iterable[AuthPattern] = ()):
+        # Configured patterns take precedence over the built-in table
+        self.patterns = tuple(extra_patterns) + DEFAULT_PATTERNS
+        self._dispatch: dict[str, _DispatchSlot] = {}
+        self._any_service = self._compile()
+
+    def _compile(self) -> _DispatchSlot:
+        """Compile the pattern table; returns the slot used for services without own patterns"""
+        compiled = []
+        for pattern in self.patterns:
+            flags = re.IGNORECASE if pattern.ignore_case else 0
+            compiled.append((re.compile(pattern.regex, flags), pattern))
+
+        services = {service for pattern in self.patterns for service in pattern.services}
+        prefixes = {pattern.prefix for pattern in self.patterns if pattern.prefix}
+
+        def build(service: Optional[str]) -> _DispatchSlot:
+            applicable = [
+                (regex, pattern)
+                for regex, pattern in compiled
+                if not pattern.services or service in pattern.services
+            ]
+            by_prefix = {
+                prefix: [
+                    (regex, pattern, pattern.prefix is not None)
+                    for regex, pattern in applicable
+                    if pattern.prefix in (None, prefix)
+                ]
+                for prefix in prefixes
+            }
+            unprefixed = [
+                (regex, pattern, False) for regex, pattern in applicable if pattern.prefix is None
+            ]
+            return by_prefix, unprefixed
+
+        for service in services:
+            self._dispatch[service] = build(service)
+        return build(None)
+
+    def parse(self, line: str) -> Optional[AuthLogEvent]:
+        """Parse a single auth.log line into a structured event"""
+        match = _LINE_RE.match(line)
+        if not match:
+            return None
+
+        timestamp_str, hostname, service, message = match.groups()
+
+        timestamp = _syslog_timestamp(timestamp_str)
+        if timestamp is None:
+            return None
+
+        return self.parse_message(timestamp, hostname, service, message)
+
+    def parse_message(
+        self, timestamp: datetime, hostname: str, service: str, message: str
+    ) -> AuthLogEvent:
+        """
+        Classify an already-split log message
+
+        Used directly by structured sources (e.g. journald) that provide the
+        timestamp, hostname and service as separate fields.
+        """
+        event_type = "unknown"
+        username = None
+        source_ip = None
+        severity = "low"
+
+        # Classify the original message of collapsed rsyslog duplicates
+        repeated = _REPEATED_RE.match(message)
+        text = repeated.group(1) if repeated else message
+
+        by_prefix, unprefixed = self._dispatch.get(service, self._any_service)
+        candidates = by_prefix.get(text.split(" ", 1)[0], unprefixed)
+        for regex, pattern, anchored in candidates:
+            found = regex.match(text) if anchored else regex.search(text)
+            if not found:
+                continue
+
+            event_type = pattern.event_type
+            severity = pattern.severity
+            groups = found.groupdict()
+            username = groups.get("user") or None
+            source_ip = groups.get("ip") or None
+            break
+
+        return AuthLogEvent(
+            timestamp=timestamp,
+            hostname=hostname,
+            service=service,
+            message=message,
+            event_type=event_type,
+            username=username,
+            source_ip=source_ip,
+            severity=severity,
+        )
+
+
+_default_parser = AuthLogParser()
+
+
+def parse_auth_log_line(
+    line: str, parser: Optional[AuthLogParser] = None
+) -> Optional[AuthLogEvent]:
     """
     Parse a single auth.log line into a structured event
 
     Example lines:
     - Nov 30 12:34:56 hostname sshd[1234]: Failed password for invalid user admin from 192.168.1.100 port 22 ssh2
     - Nov 30 12:35:01 hostname sudo: username : TTY=pts/0 ; PWD=/home/user ; USER=root ; COMMAND=/usr/bin/apt update
-    """
-    # Basic auth.log pattern: timestamp hostname service[pid]: message
-    pattern = r"^(\w{3}\s+\d{1,2}\s+\d{2}:\d{2}:\d{2})\s+(\S+)\s+(\w+)(?:\[\d+\])?: (.+)$"
-    match = re.match(pattern, line)
-
-    if not match:
-        return None
-
-    timestamp_str, hostname, service, message = match.groups()
-
-    # Parse timestamp (add current year since auth.log doesn't include it)
-    try:
-        timestamp = datetime.strptime(f"2025 {timestamp_str}", "%Y %b %d %H:%M:%S")
-    except ValueError:
-        return None
-
-    # Determine event type and extract details
-    event_type = "unknown"
-    username = None
-    source_ip = None
-    severity = "low"
-
-    # Failed password attempt
-    if "Failed password" in message or "authentication failure" in message.lower():
-        event_type = "failed_login"
-        severity = "high"
-
-        # Extract username and IP
-        user_match = re.search(r"for (?:invalid user )?(\S+)", message)
-        if user_match:
-            username = user_match.group(1)
-
-        ip_match = re.search(r"from (\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})", message)
-        if ip_match:
-            source_ip = ip_match.group(1)
-
-    # Sudo command
-    elif service == "sudo":
-        event_type = "sudo"
-        severity = "medium"
-
-        # Extract username
-        user_match = re.search(r"^\s*(\S+)\s*:", message)
-        if user_match:
-            username = user_match.group(1)
-
-    # Session opened (successful login)
-    elif "session opened" in message.lower():
-        event_type = "session_opened"
-        severity = "low"
 
-        user_match = re.search(r"for user (\S+)", message)
-        if user_match:
-            username = user_match.group(1)
-
-    return AuthLogEvent(
-        timestamp=timestamp,
-        hostname=hostname,
-        service=service,
-        message=message,
-        event_type=event_type,
-        username=username,
-        source_ip=source_ip,
-        severity=severity,
-    )
+    Args:
+        line: Raw log line
+        parser: Parser to use (defaults to one built from the default pattern table)
+    """
+    return (parser or _default_parser).parse(line)
@@ -0,0 +1,174 @@
+"""Priority queue feeding events to the analyzer"""
+
+import heapq
+import itertools
+import math
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+from .parsers import FAILED_LOGIN_EVENT_TYPES, AuthLogEvent
+
+SEVERITY_RANK = {"low": 0, "medium": 1, "high": 2, "critical": 3}
+
+# Accounts whose compromise matters most
+PRIVILEGED_USERS = frozenset({"root", "admin", "administrator", "ubuntu", "pi"})
+
+
+def severity_at_least(severity: str, minimum: str) -> bool:
+    """Compare two severity names (unknown names rank as low)"""
+    return SEVERITY_RANK.get(severity, 0) >= SEVERITY_RANK.get(minimum, 0)
+
+
+def score_event(event: AuthLogEvent, recent_attempts: int = 0) -> float:
+    """
+    Priority of an event, in severity levels
+
+    Parser severity is the base; rules add up to about two more levels for
+    privileged targets and for sources that keep trying.
+
+    Args:
+        event: Parsed event
+        recent_attempts: Prior events from the same source IP in the last hour
+    """
+    score = float(SEVERITY_RANK.get(event.severity, 0))
+    if event.username in PRIVILEGED_USERS:
+        score += 0.5
+    if event.event_type in FAILED_LOGIN_EVENT_TYPES and recent_attempts:
+        # 1 prior attempt -> +0.25, 15 -> +1.0, capped at +1.5
+        score += min(math.log2(recent_attempts + 1) / 4, 1.5)
+    return score
+
+
+@dataclass(order=True)
+class QueuedEvent:
+    """An event waiting for analysis"""
+
+    sort_key: float
+    sequence: int
+    event: AuthLogEvent = field(compare=False)
+    priority: float = field(compare=False)
+    enqueued_at: float = field(compare=False)
+    history: Optional[str] = field(default=None, compare=False)
+
+
+class AnalysisQueue:
+    """
+    Thread-safe priority queue with aging
+
+    Higher priority is served first. Every waiting item gains
+    ``aging_per_minute`` priority per minute, so low-priority work is delayed
+    under load but never starved. Because all items age at the same rate,
+    the aged order is fixed at insertion time and a plain heap suffices.
+
+    When full, the lowest-priority item is dropped and handed back to the
+    caller. A second heap ordered worst-first finds it in O(log n); items
+    taken from one heap are removed from the other lazily.
+    """
+
+    def __init__(self, maxsize: int = 10000, aging_per_minute: float = 1.0):
+        self.maxsize = maxsize
+        self.aging_per_second = aging_per_minute / 60
+        self.dropped = 0
+        self._heap: list[QueuedEvent] = []  # best first
+        self._worst: list[tuple[float, int, QueuedEvent]] = []  # worst first
+        self._removed: set[int] = set()  # sequences still present in one of the heaps
+        self._size = 0
+        self._sequence = itertools.count()
+        self._cond = threading.Condition()
+        self._closed = False
+
+    def __len__(self) -> int:
+        with self._cond:
+            return self._size
+
+    def put(
+        self,
+        event: AuthLogEvent,
+        priority: float,
+        history: Optional[str] = None,
+        now: Optional[float] = None,
+    ) -> Optional[QueuedEvent]:
+        """
+        Queue an event for analysis
+
+        Returns:
+            The item dropped to make room (the new one itself if it ranked
+            lowest or the queue is closed), or None if nothing was dropped
+        """
+        now = time.monotonic() if now is None else now
+        # Effective priority at time t is priority + rate * (t - now); ordering by
+        # priority - rate * now is equivalent and independent of t (min-heap, so negate)
+        item = QueuedEvent(
+            sort_key=-(priority - self.aging_per_second * now),
+            sequence=next(self._sequence),
+            event=event,
+            priority=priority,
+            enqueued_at=now,
+            history=history,
+        )
+        with self._cond:
+            if self._closed:
+                return item
+            dropped = None
+            if self._size >= self.maxsize:
+                self.dropped += 1
+                worst = self._peek_worst()
+                if worst is None or item > worst:
+                    return item
+                heapq.heappop(self._worst)
+                self._removed.add(worst.sequence)
+                self._size -= 1
+                dropped = worst
+                self._maybe_compact()
+            heapq.heappush(self._heap, item)
+            heapq.heappush(self._worst, (-item.sort_key, -item.sequence, item))
+            self._size += 1
+            self._cond.notify()
+        return dropped
+
+    def get(self, timeout: Optional[float] = None) -> Optional[QueuedEvent]:
+        """Remove and return the highest-priority item; None on timeout or once closed"""
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._size or self._closed, timeout):
+                return None
+            if self._closed:
+                return None
+            item = heapq.heappop(self._heap)
+            while item.sequence in self._removed:
+                self._removed.discard(item.sequence)
+                item = heapq.heappop(self._heap)
+            self._removed.add(item.sequence)
+            self._size -= 1
+            self._maybe_compact()
+            return item
+
+    def close(self) -> list[QueuedEvent]:
+        """Stop the queue, wake all waiters and return the items left unprocessed"""
+        with self._cond:
+            self._closed = True
+            remaining = sorted(item for item in self._heap if item.sequence not in self._removed)
+            self._heap, self._worst, self._removed, self._size = [], [], set(), 0
+            self._cond.notify_all()
+        return remaining
+
+    def _peek_worst(self) -> Optional[QueuedEvent]:
+        """Lowest-priority live item (lock held)"""
+        while self._worst:
+            item = self._worst[0][2]
+            if item.sequence not in self._removed:
+                return item
+            heapq.heappop(self._worst)
+            self._removed.discard(item.sequence)
+        return None
+
+    def _maybe_compact(self) -> None:
+        """Drop stale entries from both heaps once they outnumber the live ones (lock held)"""
+        if len(self._removed) <= self._size + 64:
+            return
+        self._heap = [item for item in self._heap if item.sequence not in self._removed]
+        heapq.heapify(self._heap)
+        self._worst = [(-item.sort_key, -item.sequence, item) for item in self._heap]
+        heapq.heapify(self._worst)
+        self._removed.clear()
@@ -0,0 +1,286 @@
+"""Embedded event store backed by SQLite"""
+
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional
+
+from .parsers import AuthLogEvent
+
+if TYPE_CHECKING:
+    from .ai import ThreatAnalysis
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    ts REAL NOT NULL,
+    hostname TEXT NOT NULL,
+    service TEXT NOT NULL,
+    event_type TEXT NOT NULL,
+    username TEXT,
+    source_ip TEXT,
+    severity TEXT NOT NULL,
+    message TEXT NOT NULL,
+    verdict TEXT,
+    is_threat INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_events_ts ON events (ts);
+CREATE INDEX IF NOT EXISTS idx_events_ip_ts ON events (source_ip, ts);
+CREATE INDEX IF NOT EXISTS idx_events_user_ts ON events (username, ts);
+CREATE INDEX IF NOT EXISTS idx_events_type_ts ON events (event_type, ts);
+"""
+
+_INSERT = """
+INSERT INTO events (
+    ts, hostname, service, event_type, username, source_ip, severity, message, verdict, is_threat
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_COLUMNS = (
+    "ts, hostname, service, event_type, username, source_ip, severity, message, verdict, is_threat"
+)
+
+_STOP = object()
+
+
+@dataclass
+class StoredEvent:
+    """An event read back from the store, with the analyzer verdict if one was made"""
+
+    event: AuthLogEvent
+    verdict: Optional[str] = None  # analyzer severity
+    is_threat: Optional[bool] = None
+
+
+class EventStore:
+    """
+    Append-only event history in SQLite (WAL mode)
+
+    Writes are queued and committed in batches by a background thread, so
+    add() never blocks ingestion on disk I/O. Reads use a per-thread
+    connection and hit the (column, ts) indexes.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        retention_days: int = 30,
+        batch_size: int = 200,
+        flush_interval: float = 1.0,
+    ):
+        self.path = Path(path)
+        self.retention_days = retention_days
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.executescript(_SCHEMA)
+
+        self._local = threading.local()
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._closed = False
+        self._close_lock = threading.Lock()  # no add() may slip in behind _STOP
+        self._writer = threading.Thread(target=self._write_loop, name="hlg-store", daemon=True)
+        self._writer.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=10)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _reader(self) -> sqlite3.Connection:
+        """Connection owned by the calling thread"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+        return conn
+
+    # Writing
+
+    def add(self, event: AuthLogEvent, analysis: Optional["ThreatAnalysis"] = None) -> None:
+        """Queue an event (and optionally its analysis) for writing"""
+        row = (
+            event.timestamp.timestamp(),
+            event.hostname,
+            event.service,
+            event.event_type,
+            event.username,
+            event.source_ip,
+            event.severity,
+            event.message,
+            analysis.severity if analysis else None,
+            int(analysis.is_threat) if analysis else None,
+        )
+        with self._close_lock:
+            if self._closed:
+                print(f"⚠️  Event store closed, not recording {event.event_type} event")
+                return
+            self._queue.put(row)
+
+    def flush(self) -> None:
+        """Block until every queued event has been committed"""
+        self._queue.join()
+
+    def close(self) -> None:
+        """Flush pending writes and stop the writer thread"""
+        with self._close_lock:
+            if not self._closed:
+                self._closed = True
+                self._queue.put(_STOP)
+        self._writer.join()
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def _write_loop(self) -> None:
+        conn = self._connect()
+        # Retention runs hourly; compact() prunes on demand
+        last_prune = time.monotonic()
+        running = True
+        try:
+            while running:
+                batch = []
+                try:
+                    batch.append(self._queue.get(timeout=self.flush_interval))
+                    while len(batch) < self.batch_size:
+                        batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    pass
+
+                rows = [row for row in batch if row is not _STOP]
+                running = len(rows) == len(batch)
+                try:
+                    if rows:
+                        with conn:
+                            conn.executemany(_INSERT, rows)
+                    if self.retention_days and time.monotonic() - last_prune > 3600:
+                        self._prune(conn, self.retention_days)
+                        last_prune = time.monotonic()
+                except sqlite3.Error as e:
+                    print(f"❌ Event store write failed: {e}")
+                finally:
+                    for _ in batch:
+                        self._queue.task_done()
+        finally:
+            conn.close()
+
+    # Retention
+
+    @staticmethod
+    def _prune(conn: sqlite3.Connection, retention_days: int) -> int:
+        cutoff = (datetime.now() - timedelta(days=retention_days)).timestamp()
+        with conn:
+            return conn.execute("DELETE FROM events WHERE ts < ?", (cutoff,)).rowcount
+
+    def compact(self, retention_days: Optional[int] = None) -> int:
+        """
+        Drop events past retention and reclaim disk space
+
+        Args:
+            retention_days: Override the store's retention period
+
+        Returns:
+            Number of events removed
+        """
+        self.flush()
+        conn = self._reader()
+        if retention_days is None:
+            retention_days = self.retention_days
+        removed = self._prune(conn, retention_days)
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        conn.execute("VACUUM")
+        return removed
+
+    # Reading
+
+    @staticmethod
+    def _where(
+        source_ip: Optional[str],
+        username: Optional[str],
+        event_type: Optional[str],
+        since: Optional[datetime],
+    ) -> tuple[str, list[Any]]:
+        clauses: list[str] = []
+        params: list[Any] = []
+        for column, value in (
+            ("source_ip", source_ip),
+            ("username", username),
+            ("event_type", event_type),
+        ):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if since is not None:
+            clauses.append("ts >= ?")
+            params.append(since.timestamp())
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def query(
+        self,
+        source_ip: Optional[str] = None,
+        username: Optional[str] = None,
+        event_type: Optional[str] = None,
+        since: Optional[datetime] = None,
+        limit: int = 100,
+    ) -> list[StoredEvent]:
+        """Return the most recent matching events, newest first"""
+        where, params = self._where(source_ip, username, event_type, since)
+        rows = self._reader().execute(
+            f"SELECT {_COLUMNS} FROM events{where} ORDER BY ts DESC LIMIT ?", (*params, limit)
+        )
+        return [
+            StoredEvent(
+                event=AuthLogEvent(
+                    timestamp=datetime.fromtimestamp(ts),
+                    hostname=hostname,
+                    service=service,
+                    message=message,
+                    event_type=event_type,
+                    username=username,
+                    source_ip=source_ip,
+                    severity=severity,
+                ),
+                verdict=verdict,
+                is_threat=None if is_threat is None else bool(is_threat),
+            )
+            for (
+                ts,
+                hostname,
+                service,
+                event_type,
+                username,
+                source_ip,
+                severity,
+                message,
+                verdict,
+                is_threat,
+            ) in rows
+        ]
+
+    def count(
+        self,
+        source_ip: Optional[str] = None,
+        username: Optional[str] = None,
+        event_type: Optional[str] = None,
+        since: Optional[datetime] = None,
+    ) -> int:
+        """Count matching events"""
+        where, params = self._where(source_ip, username, event_type, since)
+        row = self._reader().execute(f"SELECT COUNT(*) FROM events{where}", params).fetchone()
+        return int(row[0])
+
+    def first_seen(
+        self, source_ip: Optional[str] = None, username: Optional[str] = None
+    ) -> Optional[datetime]:
+        """Timestamp of the oldest stored event for an IP and/or user"""
+        where, params = self._where(source_ip, username, None, None)
+        ts = self._reader().execute(f"SELECT MIN(ts) FROM events{where}", params).fetchone()[0]
+        return datetime.fromtimestamp(ts) if ts is not None else None
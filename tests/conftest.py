@@ -0,0 +1,69 @@
+"""Shared test fixtures"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from hlg.parsers.auth import AuthLogEvent
+
+# event_type -> (service, message template, default source IP)
+_TEMPLATES = {
+    "failed_login": (
+        "sshd",
+        "Failed password for {username} from {source_ip} port 22 ssh2",
+        "203.0.113.7",
+    ),
+    "invalid_user": ("sshd", "Invalid user {username} from {source_ip} port 22", "203.0.113.7"),
+    "accepted_login": (
+        "sshd",
+        "Accepted publickey for {username} from {source_ip} port 22 ssh2",
+        "203.0.113.7",
+    ),
+    "sudo": (
+        "sudo",
+        "{username} : TTY=pts/0 ; PWD=/home/{username} ; USER=root ; COMMAND=/usr/bin/ls",
+        None,
+    ),
+}
+
+_DEFAULT = object()
+
+
+@pytest.fixture
+def make_event():
+    """
+    Factory for realistic AuthLogEvents
+
+    Positional arguments are event_type, severity and username. Service,
+    message and source IP follow from the event type (an sshd failed
+    password by default; sudo events have no source IP). The timestamp is
+    ``minutes_ago`` before ``now`` (default: the current time). Any other
+    AuthLogEvent field can be overridden by keyword.
+    """
+
+    def make(
+        event_type="failed_login",
+        severity="high",
+        username="root",
+        source_ip=_DEFAULT,
+        minutes_ago=0,
+        now=None,
+        **fields,
+    ):
+        service, template, default_ip = _TEMPLATES[event_type]
+        if source_ip is _DEFAULT:
+            source_ip = default_ip
+        values = {
+            "timestamp": (now or datetime.now()) - timedelta(minutes=minutes_ago),
+            "hostname": "labhost",
+            "service": service,
+            "message": template.format(username=username, source_ip=source_ip),
+            "event_type": event_type,
+            "username": username,
+            "source_ip": source_ip,
+            "severity": severity,
+        }
+        values.update(fields)
+        return AuthLogEvent(**values)
+
+    return make
@@ -4,7 +4,14 @@ from datetime import datetime
 
 import pytest
 
-from hlg.parsers.auth import AuthLogEvent, parse_auth_log_line
+from hlg.parsers.auth import (
+    IP_PATTERN,
+    AuthLogEvent,
+    AuthLogParser,
+    AuthPattern,
+    _syslog_timestamp,
+    parse_auth_log_line,
+)
 
 
 def test_parse_failed_password():
@@ -59,3 +66,171 @@ def test_parse_failed_authentication():
     assert event is not None
     assert event.event_type == "failed_login"
     assert event.severity == "high"
+
+
+def test_parse_failed_password_ipv6():
+    """Test parsing failed password attempt from an IPv6 address"""
+    line = (
+        "Nov 30 12:38:00 hostname sshd[1234]: "
+        "Failed password for root from 2001:db8::1 port 22 ssh2"
+    )
+    event = parse_auth_log_line(line)
+
+    assert event is not None
+    assert event.event_type == "failed_login"
+    assert event.username == "root"
+    assert event.source_ip == "2001:db8::1"
+
+
+@pytest.mark.parametrize(
+    "message,event_type,username,source_ip",
+    [
+        ("Invalid user admin from 203.0.113.7 port 40022", "invalid_user", "admin", "203.0.113.7"),
+        (
+            "Connection closed by authenticating user root 2001:db8::5 port 51234 [preauth]",
+            "connection_closed",
+            "root",
+            "2001:db8::5",
+        ),
+        (
+            "error: maximum authentication attempts exceeded for root from 10.0.0.9 port 22 "
+            "ssh2 [preauth]",
+            "max_auth_attempts",
+            "root",
+            "10.0.0.9",
+        ),
+        (
+            "Accepted publickey for john from 192.168.1.20 port 50000 ssh2: ED25519 SHA256:abc",
+            "accepted_login",
+            "john",
+            "192.168.1.20",
+        ),
+        (
+            "reverse mapping checking getaddrinfo for bad.example [198.51.100.3] failed - "
+            "POSSIBLE BREAK-IN ATTEMPT!",
+            "break_in_attempt",
+            None,
+            "198.51.100.3",
+        ),
+        (
+            "Address 198.51.100.4 maps to bad.example, but this does not map back to the "
+            "address - POSSIBLE BREAK-IN ATTEMPT!",
+            "break_in_attempt",
+            None,
+            "198.51.100.4",
+        ),
+    ],
+)
+def test_parse_sshd_messages(message, event_type, username, source_ip):
+    """Test parsing the extended set of sshd messages"""
+    event = parse_auth_log_line(f"Nov 30 12:39:00 hostname sshd[4242]: {message}")
+
+    assert event is not None
+    assert event.event_type == event_type
+    assert event.username == username
+    assert event.source_ip == source_ip
+
+
+@pytest.mark.parametrize(
+    "line,username,source_ip",
+    [
+        (
+            "Nov 30 12:39:10 hostname sshd[4242]: PAM 2 more authentication failures; logname= "
+            "uid=0 euid=0 tty=ssh ruser= rhost=1.2.3.4  user=root",
+            "root",
+            "1.2.3.4",
+        ),
+        (
+            "Nov 30 12:39:11 hostname login[1]: FAILED LOGIN (1) on '/dev/tty1' FOR 'root', "
+            "Authentication failure",
+            "root",
+            None,
+        ),
+        (
+            "Nov 30 12:39:12 hostname sshd[4242]: Failed password for root from "
+            "host.example.com port 22 ssh2",
+            "root",
+            None,
+        ),
+        (
+            "Nov 30 12:39:13 hostname su[77]: pam_authenticate: Authentication failure",
+            None,
+            None,
+        ),
+    ],
+)
+def test_parse_failed_login_variants(line, username, source_ip):
+    """Test failed logins without an IP or with plural/uppercase wording (baseline regressions)"""
+    event = parse_auth_log_line(line)
+
+    assert event is not None
+    assert event.event_type == "failed_login"
+    assert event.severity == "high"
+    assert event.username == username
+    assert event.source_ip == source_ip
+
+
+def test_parse_repeated_message():
+    """Test that rsyslog "message repeated N times" lines are classified by their content"""
+    line = (
+        "Nov 30 12:39:30 hostname sshd[1]: message repeated 3 times: "
+        "[ Failed password for root from 1.2.3.4 port 22 ssh2]"
+    )
+    event = parse_auth_log_line(line)
+
+    assert event is not None
+    assert event.event_type == "failed_login"
+    assert event.username == "root"
+    assert event.source_ip == "1.2.3.4"
+
+
+@pytest.mark.parametrize(
+    "stamp,expected",
+    [
+        ("Jan 10 09:00:00", datetime(2026, 1, 10, 9, 0, 0)),
+        ("Mar 14 09:00:00", datetime(2025, 3, 14, 9, 0, 0)),
+        ("Dec 31 23:59:59", datetime(2025, 12, 31, 23, 59, 59)),
+        ("Jan 16 08:00:00", datetime(2026, 1, 16, 8, 0, 0)),  # within clock skew
+        ("Feb 29 10:00:00", None),  # neither 2026 nor 2025 is a leap year
+    ],
+)
+def test_syslog_timestamp_year(stamp, expected):
+    """Test that the year is inferred and rolled back when it would be in the future"""
+    assert _syslog_timestamp(stamp, now=datetime(2026, 1, 15, 12, 0, 0)) == expected
+
+
+def test_parse_unknown_message():
+    """Test that unrecognised messages are still returned as unknown events"""
+    line = "Nov 30 12:40:00 hostname sshd[4242]: Server listening on 0.0.0.0 port 22."
+    event = parse_auth_log_line(line)
+
+    assert event is not None
+    assert event.event_type == "unknown"
+    assert event.username is None
+
+
+def test_custom_pattern_takes_precedence():
+    """Test that configured patterns are tried before the built-in table"""
+    parser = AuthLogParser(
+        [
+            AuthPattern(
+                event_type="root_login",
+                regex=r"Accepted \S+ for (?P<user>root) from " + IP_PATTERN,
+                severity="high",
+                services=["sshd"],
+                prefix="Accepted",
+            )
+        ]
+    )
+
+    root = parser.parse(
+        "Nov 30 12:41:00 hostname sshd[1]: Accepted password for root from ::1 port 22"
+    )
+    user = parser.parse(
+        "Nov 30 12:41:00 hostname sshd[1]: Accepted password for bob from ::1 port 22"
+    )
+
+    assert root.event_type == "root_login"
+    assert root.severity == "high"
+    assert root.source_ip == "::1"
+    assert user.event_type == "accepted_login"
@@ -0,0 +1,130 @@
+"""Tests for the LLM circuit breaker"""
+
+import sys
+import threading
+import time
+
+from hlg.ai.analyzer import ThreatAnalyzer
+from hlg.ai.breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _breaker(**kwargs):
+    clock = FakeClock()
+    breaker = CircuitBreaker(
+        failure_threshold=2, latency_threshold=5.0, reset_timeout=30.0, clock=clock, **kwargs
+    )
+    changes = []
+    breaker.add_listener(lambda old, new, reason: changes.append((old, new)))
+    return breaker, clock, changes
+
+
+def test_trips_after_consecutive_failures():
+    """Test that errors and slow responses open the circuit"""
+    breaker, _, changes = _breaker()
+
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+    breaker.record_success(9.0)  # too slow, counts as a failure
+
+    assert breaker.state == OPEN
+    assert not breaker.allow()
+    assert changes == [(CLOSED, OPEN)]
+    assert breaker.transitions[(CLOSED, OPEN)] == 1
+
+
+def test_success_resets_failure_count():
+    """Test that a fast response clears earlier failures"""
+    breaker, _, _ = _breaker()
+
+    breaker.record_failure()
+    breaker.record_success(0.5)
+    breaker.record_failure()
+
+    assert breaker.state == CLOSED
+
+
+def test_half_open_request_probe():
+    """Test recovery through a real request after the cooldown"""
+    breaker, clock, changes = _breaker()
+    breaker.record_failure()
+    breaker.record_failure()
+
+    clock.now = 31.0
+    assert breaker.allow()  # this request is the probe
+    assert not breaker.allow()  # only one probe at a time
+    breaker.record_failure("still down")
+    assert breaker.state == OPEN
+
+    clock.now = 62.0
+    assert breaker.allow()
+    breaker.record_success(1.0)
+
+    assert breaker.state == CLOSED
+    assert changes == [
+        (CLOSED, OPEN),
+        (OPEN, HALF_OPEN),
+        (HALF_OPEN, OPEN),
+        (OPEN, HALF_OPEN),
+        (HALF_OPEN, CLOSED),
+    ]
+
+
+def test_background_probe():
+    """Test that a probe callable recovers the circuit without holding up requests"""
+    probed = threading.Event()
+    breaker, clock, _ = _breaker(probe=probed.set)
+    breaker.record_failure()
+    breaker.record_failure()
+
+    clock.now = 31.0
+    assert not breaker.allow()  # the caller goes straight to rule-based analysis
+
+    assert probed.wait(timeout=5)
+    for _ in range(100):
+        if breaker.state == CLOSED:
+            break
+        time.sleep(0.01)
+    assert breaker.state == CLOSED
+
+
+def test_analyzer_skips_llm_when_open(make_event):
+    """Test that an open circuit returns rule-based analysis without calling the LLM"""
+
+    class FailingLLM:
+        calls = 0
+
+        def invoke(self, messages):
+            self.calls += 1
+            raise ConnectionError("connection refused")
+
+    breaker, _, _ = _breaker()
+    analyzer = ThreatAnalyzer(breaker=breaker)
+    analyzer.llm = FailingLLM()
+    event = make_event()
+
+    results = [analyzer.analyze(event) for _ in range(5)]
+
+    assert analyzer.llm.calls == 2
+    assert breaker.state == OPEN
+    assert all(result.is_threat and result.severity == "high" for result in results)
+
+
+def test_missing_llm_stack_falls_back(monkeypatch, make_event):
+    """Test that a broken LangChain install degrades to rules and trips the breaker"""
+    monkeypatch.setitem(sys.modules, "langchain_core.messages", None)
+    breaker, _, _ = _breaker()
+    analyzer = ThreatAnalyzer(breaker=breaker)
+    analyzer.llm = object()
+
+    results = [analyzer.analyze(make_event()) for _ in range(4)]
+
+    assert breaker.state == OPEN
+    assert all(result.is_threat and result.severity == "high" for result in results)
@@ -29,3 +29,22 @@ def test_cli_run_missing_log(tmp_path):
     result = runner.invoke(cli, ["run", "--log-path", str(tmp_path / "nonexistent.log")])
     assert result.exit_code != 0
     assert "not found" in result.output or "does not exist" in result.output
+
+
+def test_cli_query(tmp_path, make_event):
+    """Test query command against a populated event store"""
+    from hlg.store import EventStore
+
+    path = str(tmp_path / "events.db")
+    store = EventStore(path)
+    store.add(make_event("invalid_user", username="admin", source_ip="10.0.0.7"))
+    store.close()
+
+    runner = CliRunner()
+    result = runner.invoke(cli, ["query", "--store", path, "--ip", "10.0.0.7", "--since", "1h"])
+    assert result.exit_code == 0
+    assert "invalid_user" in result.output
+
+    result = runner.invoke(cli, ["query", "--store", path, "--user", "root", "--count"])
+    assert result.exit_code == 0
+    assert result.output.strip() == "0"
@@ -0,0 +1,104 @@
+"""Tests for the remote syslog collector"""
+
+import queue
+import socket
+
+import pytest
+
+from hlg.collector import SyslogCollector, parse_syslog_message, watch_syslog
+from hlg.parsers.auth import AuthLogParser
+
+RFC3164 = (
+    "<38>Nov 30 12:34:56 web01 sshd[1234]: Failed password for root from 2001:db8::7 port 22 ssh2"
+)
+RFC5424 = (
+    "<86>1 2025-11-30T12:35:01.003Z db01 sudo - - - "
+    "alice : TTY=pts/0 ; PWD=/home/alice ; USER=root ; COMMAND=/bin/ls"
+)
+
+
+def test_parse_rfc3164():
+    """Test parsing a BSD syslog message"""
+    event = parse_syslog_message(RFC3164, AuthLogParser())
+
+    assert event.hostname == "web01"
+    assert event.event_type == "failed_login"
+    assert event.source_ip == "2001:db8::7"
+
+
+def test_parse_rfc5424():
+    """Test parsing an RFC 5424 message with structured data omitted"""
+    event = parse_syslog_message(RFC5424, AuthLogParser())
+
+    assert event.hostname == "db01"
+    assert event.service == "sudo"
+    assert event.event_type == "sudo"
+    assert event.username == "alice"
+    assert event.timestamp.year == 2025
+
+
+def test_parse_filters_non_auth_facilities():
+    """Test that messages outside auth/authpriv are dropped"""
+    mail = "<22>Nov 30 12:34:56 web01 postfix[1]: connect from unknown[10.0.0.1]"
+
+    assert parse_syslog_message(mail, AuthLogParser()) is None
+    assert parse_syslog_message(mail, AuthLogParser(), facilities=None) is not None
+
+
+@pytest.fixture
+def collector():
+    collector = SyslogCollector(bind="127.0.0.1", udp_port=0, tcp_port=0, flush_interval=0.02)
+    collector.start()
+    yield collector
+    collector.stop()
+
+
+def _drain(collector, count):
+    return [collector.events.get(timeout=5) for _ in range(count)]
+
+
+def test_collector_udp_and_tcp(collector):
+    """Test receiving from loopback senders over both transports"""
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as udp:
+        udp.sendto(RFC3164.encode(), ("127.0.0.1", collector.udp_port))
+
+    with socket.create_connection(("127.0.0.1", collector.tcp_port)) as tcp:
+        # One octet-counted frame followed by one newline-terminated frame
+        framed = RFC5424.encode()
+        tcp.sendall(str(len(framed)).encode() + b" " + framed)
+        tcp.sendall(RFC3164.replace("web01", "web02").encode() + b"\n")
+
+        events = _drain(collector, 3)
+
+    assert sorted(event.hostname for event in events) == ["db01", "web01", "web02"]
+    assert collector.received["127.0.0.1"] == 3
+
+
+def test_collector_batches_per_host():
+    """Test that buffers are kept per sending host and flushed at batch size"""
+    collector = SyslogCollector(udp_port=None, tcp_port=None, batch_size=2)
+
+    collector.submit("10.0.0.1", RFC3164)
+    collector.submit("10.0.0.2", RFC5424)
+    with pytest.raises(queue.Empty):
+        collector.events.get_nowait()
+
+    collector.submit("10.0.0.1", RFC3164)
+    assert [e.hostname for e in _drain(collector, 2)] == ["web01", "web01"]
+
+    collector.flush()
+    assert collector.events.get_nowait().hostname == "db01"
+
+
+def test_watch_syslog_stops_when_idle():
+    """Test that shutdown is noticed without waiting for another message"""
+    collector = SyslogCollector(bind="127.0.0.1", udp_port=0, tcp_port=0)
+    checks = []
+
+    def keep_running():
+        checks.append(None)
+        return len(checks) < 3
+
+    assert list(watch_syslog(collector, poll_interval=0.01, keep_running=keep_running)) == []
+    assert len(checks) == 3
+    assert collector._thread is None  # stopped and joined
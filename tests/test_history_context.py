@@ -0,0 +1,87 @@
+"""Tests for LLM history context"""
+
+from datetime import datetime
+from functools import partial
+
+import pytest
+
+from hlg.ai.analyzer import ThreatAnalyzer
+from hlg.ai.context import HistoryTracker
+
+NOW = datetime(2025, 11, 30, 12, 0, 0)
+
+
+@pytest.fixture
+def event(make_event):
+    """Events at fixed times so bucket boundaries and first-seen output are stable"""
+    return partial(make_event, now=NOW)
+
+
+def test_summary_none_for_unseen(event):
+    """Test that first-time IPs and users produce no context"""
+    tracker = HistoryTracker()
+    assert tracker.summary(event()) is None
+
+
+def test_summary_counts_and_verdicts(event):
+    """Test rolling counts, first-seen time and prior verdicts"""
+    tracker = HistoryTracker(token_budget=500)
+    tracker.record(event(minutes_ago=180, username="admin"))
+    for minutes in (50, 20, 5):
+        tracker.record(event(minutes_ago=minutes))
+    tracker.record_verdict(event(minutes_ago=5), "high", True)
+
+    summary = tracker.summary(event())
+
+    lines = summary.splitlines()
+    assert lines[0].startswith("IP 203.0.113.7: 3 prior events in 1h, 4 in 24h")
+    assert "first seen 2025-11-30 09:00" in lines[0]
+    assert "prior verdicts high (1 threats)" in lines[0]
+    assert "2 distinct usernames tried" in lines[0]
+    assert lines[1].startswith("User root: 3 prior events in 1h, 3 in 24h")
+
+
+def test_summary_respects_token_budget(event):
+    """Test that the summary shrinks to fit a small budget, keeping headline counts"""
+    tracker = HistoryTracker()
+    for i in range(500):
+        tracker.record(event(minutes_ago=i % 600, username=f"user{i}"))
+    latest = event(username="user1")
+
+    full = tracker.summary(latest, token_budget=1000)
+    small = tracker.summary(latest, token_budget=30)
+
+    assert len(small) < len(full)
+    assert len(small) <= 30 * 4
+    assert small.startswith("IP 203.0.113.7:")
+    assert "User user1:" in small
+
+
+def test_old_events_leave_window(event):
+    """Test that events older than 24h no longer count"""
+    tracker = HistoryTracker()
+    tracker.record(event(minutes_ago=60 * 25))
+
+    assert "0 prior events in 1h, 0 in 24h" in tracker.summary(event())
+
+
+def test_analyze_includes_history_in_prompt(event):
+    """Test that the history summary is sent to the LLM"""
+
+    class FakeLLM:
+        def invoke(self, messages):
+            self.prompt = messages[-1].content
+
+            class Response:
+                content = "SEVERITY: critical\nEXPLANATION: Sustained attack.\nIS_THREAT: yes"
+
+            return Response()
+
+    analyzer = ThreatAnalyzer()
+    analyzer.llm = FakeLLM()
+
+    analysis = analyzer.analyze(event(), history="IP 203.0.113.7: 500 prior events in 1h")
+
+    assert "Recent history:\nIP 203.0.113.7: 500 prior events in 1h" in analyzer.llm.prompt
+    assert analysis.severity == "critical"
+    assert analysis.is_threat
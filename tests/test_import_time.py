@@ -0,0 +1,60 @@
+"""Import-time budget for CLI startup
+
+Runs ``python -X importtime`` in a fresh interpreter and fails if startup
+pulls in the heavy stacks again or exceeds the time budget. Override the
+budget with HLG_IMPORT_BUDGET_MS on slow machines.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Loaded only when analysis, notifications or pydantic settings are actually needed
+HEAVY_MODULES = ("langchain_core", "langchain_ollama", "ollama", "httpx", "requests")
+
+CLI_BUDGET_MS = float(os.environ.get("HLG_IMPORT_BUDGET_MS", "150"))
+
+
+def _import_profile(statement: str) -> dict[str, int]:
+    """Cumulative import time (microseconds) per module for ``statement``"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    profile = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = (part.strip() for part in line.split(":", 1)[1].split("|"))
+        profile[name] = int(cumulative)
+    return profile
+
+
+def _heavy(profile: dict[str, int]) -> list[str]:
+    return [name for name in profile if name.split(".")[0] in HEAVY_MODULES]
+
+
+def test_cli_import_is_light():
+    """`hlg --version` / `hlg config` must not load the LLM, HTTP or pydantic stacks"""
+    profile = _import_profile("import hlg.cli")
+
+    assert _heavy(profile) == []
+    assert "pydantic_settings" not in profile
+
+
+@pytest.mark.parametrize("module", ["hlg.agent", "hlg.ai", "hlg.notifiers"])
+def test_package_import_defers_heavy_dependencies(module):
+    """Importing the packages must not load LangChain or requests until they are used"""
+    assert _heavy(_import_profile(f"import {module}")) == []
+
+
+def test_cli_import_budget():
+    """Cumulative import time of hlg.cli stays within budget"""
+    # Take the best of a few runs to smooth out a cold disk cache
+    elapsed_ms = min(_import_profile("import hlg.cli")["hlg.cli"] for _ in range(3)) / 1000
+
+    assert elapsed_ms <= CLI_BUDGET_MS, f"hlg.cli import took {elapsed_ms:.0f}ms"
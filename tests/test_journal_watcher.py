@@ -0,0 +1,117 @@
+"""Tests for the journald event source"""
+
+import struct
+
+import pytest
+
+from hlg.journal_watcher import (
+    DEFAULT_JOURNAL_MATCHES,
+    JournalCursor,
+    is_after_cursor,
+    read_journal_export,
+    read_journal_export_events,
+)
+
+
+def _entry(seqnum, unit, identifier, message, binary=False):
+    """Build one journal export entry"""
+    fields = [
+        f"__CURSOR=s=abc123;i={seqnum:x};b=boot;m=1;t=1;x=1".encode(),
+        b"__REALTIME_TIMESTAMP=1764506096000000",
+        b"_HOSTNAME=labhost",
+        f"SYSLOG_IDENTIFIER={identifier}".encode(),
+        f"_SYSTEMD_UNIT={unit}".encode(),
+    ]
+    if binary:
+        data = message.encode()
+        fields.append(b"MESSAGE\n" + struct.pack("<Q", len(data)) + data)
+    else:
+        fields.append(f"MESSAGE={message}".encode())
+    return b"\n".join(fields) + b"\n\n"
+
+
+@pytest.fixture
+def export_file(tmp_path):
+    """Journal export file with sshd, sudo and unrelated entries"""
+    path = tmp_path / "auth.export"
+    path.write_bytes(
+        _entry(1, "ssh.service", "sshd", "Failed password for root from 2001:db8::1 port 22 ssh2")
+        + _entry(2, "cron.service", "CRON", "pam_unix(cron:session): session opened for user root")
+        + _entry(3, "session-1.scope", "sudo", "alice : TTY=pts/0 ; USER=root ; COMMAND=/bin/ls")
+        + _entry(4, "ssh.service", "sshd", "Invalid user bob\nfrom 10.0.0.1", binary=True)
+    )
+    return path
+
+
+def test_read_journal_export(export_file):
+    """Test reading text and binary fields from an export file"""
+    entries = list(read_journal_export(str(export_file)))
+
+    assert len(entries) == 4
+    assert entries[0]["SYSLOG_IDENTIFIER"] == "sshd"
+    assert entries[3]["MESSAGE"] == b"Invalid user bob\nfrom 10.0.0.1"
+    # Fields not needed for events are dropped
+    assert "_SYSTEMD_UNIT" not in entries[0]
+
+
+def test_export_events_filtered_and_structured(export_file):
+    """Test that matches filter entries and fields map onto events"""
+    events = list(
+        read_journal_export_events(
+            str(export_file), ["SYSLOG_IDENTIFIER=sshd", "SYSLOG_IDENTIFIER=sudo"]
+        )
+    )
+
+    assert [e.event_type for e in events] == ["failed_login", "sudo", "unknown"]
+    assert events[0].hostname == "labhost"
+    assert events[0].service == "sshd"
+    assert events[0].source_ip == "2001:db8::1"
+    assert events[0].timestamp.year == 2025
+    assert events[1].username == "alice"
+
+
+def test_export_events_default_matches(export_file):
+    """Test that the default _SYSTEMD_UNIT/SYSLOG_IDENTIFIER matches select auth entries"""
+    events = list(read_journal_export_events(str(export_file), DEFAULT_JOURNAL_MATCHES))
+
+    assert [e.service for e in events] == ["sshd", "sudo", "sshd"]
+    assert [e.event_type for e in events] == ["failed_login", "sudo", "unknown"]
+
+
+def test_export_events_resume_from_cursor(export_file, tmp_path):
+    """Test that a persisted cursor skips already processed entries"""
+    cursor_file = tmp_path / "state" / "journal.cursor"
+    matches = ["SYSLOG_IDENTIFIER=sshd"]
+
+    first = list(read_journal_export_events(str(export_file), matches, str(cursor_file)))
+    assert len(first) == 2
+    assert "i=4;" in cursor_file.read_text()
+
+    second = list(read_journal_export_events(str(export_file), matches, str(cursor_file)))
+    assert second == []
+
+
+def test_unwritable_cursor_does_not_stop_ingestion(export_file, tmp_path, capsys):
+    """Test that a cursor file that cannot be written only warns, once"""
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("")
+    cursor_file = str(blocker / "journal.cursor")
+
+    events = list(read_journal_export_events(str(export_file), cursor_file=cursor_file))
+    assert len(events) == 3
+
+    cursor = JournalCursor(cursor_file)
+    cursor.save("s=abc123;i=1")
+    cursor.save("s=abc123;i=2")
+    assert cursor.load() is None
+    assert capsys.readouterr().out.count("Journal cursor not persisted") == 2
+
+
+def test_is_after_cursor():
+    """Test cursor ordering within and across journal sequences"""
+    stored = "s=abc;i=10;b=x"
+
+    assert is_after_cursor("s=abc;i=11;b=x", stored)
+    assert not is_after_cursor("s=abc;i=a;b=x", stored)
+    assert is_after_cursor("s=other;i=1;b=x", stored)
+    assert is_after_cursor("s=abc;i=1;b=x", None)
@@ -0,0 +1,109 @@
+"""Tests for the analysis priority queue"""
+
+import threading
+
+from hlg.agent import HomeLabGuardian
+from hlg.config import Settings
+from hlg.scheduler import AnalysisQueue, score_event, severity_at_least
+
+
+def test_score_event(make_event):
+    """Test that severity is the base and rules raise repeated privileged attempts"""
+    sudo = score_event(make_event("sudo", "medium", "alice"))
+    typo = score_event(make_event(username="alice"))
+    brute_force = score_event(make_event(), recent_attempts=500)
+
+    assert sudo < typo < brute_force
+    assert brute_force <= 2 + 0.5 + 1.5
+
+
+def test_queue_orders_by_priority(make_event):
+    """Test that the highest-priority event is served first, FIFO among equals"""
+    queue = AnalysisQueue()
+    queue.put(make_event("sudo", "medium", "a"), 1.0, now=0)
+    queue.put(make_event(username="b"), 3.0, now=0)
+    queue.put(make_event("sudo", "medium", "c"), 1.0, now=0)
+
+    assert [queue.get(timeout=0).event.username for _ in range(3)] == ["b", "a", "c"]
+    assert queue.get(timeout=0) is None
+
+
+def test_queue_aging_prevents_starvation(make_event):
+    """Test that a low-priority event waiting long enough overtakes fresh high ones"""
+    queue = AnalysisQueue(aging_per_minute=1.0)
+    queue.put(make_event("sudo", "medium", "old"), 1.0, now=0)
+    queue.put(make_event(username="fresh"), 2.0, now=30)
+    queue.put(make_event(username="later"), 2.0, now=120)
+
+    assert [queue.get(timeout=0).event.username for _ in range(3)] == ["fresh", "old", "later"]
+
+
+def test_queue_full_drops_lowest_priority(make_event):
+    """Test that overflow evicts the least important event and hands it back"""
+    queue = AnalysisQueue(maxsize=2)
+    assert queue.put(make_event(username="low"), 0.0, now=0) is None
+    assert queue.put(make_event(username="mid"), 1.0, now=0) is None
+    assert queue.put(make_event(username="high"), 3.0, now=0).event.username == "low"
+    assert queue.put(make_event(username="lowest"), -1.0, now=0).event.username == "lowest"
+
+    assert queue.dropped == 2
+    assert len(queue) == 2
+    assert [item.event.username for item in queue.close()] == ["high", "mid"]
+
+
+def test_queue_accounts_for_every_item(make_event):
+    """Test that each item is served, dropped or left over exactly once"""
+    queue = AnalysisQueue(maxsize=5)
+    served, dropped = [], []
+    for i in range(1000):
+        evicted = queue.put(make_event(username=f"u{i}"), float(i % 7), now=0)
+        if evicted:
+            dropped.append(evicted.event.username)
+        if i % 3 == 0:
+            served.append(queue.get(timeout=0).event.username)
+
+    # Stale entries left behind by lazy removal stay bounded
+    assert len(queue._heap) + len(queue._worst) <= 4 * 5 + 2 * 64
+    remaining = [item.event.username for item in queue.close()]
+    names = served + dropped + remaining
+    assert sorted(names) == sorted(f"u{i}" for i in range(1000))
+    assert len(remaining) == 4  # full, then one served on the last iteration
+
+
+def test_ingest_stores_evicted_event(tmp_path, make_event):
+    """Test that an event evicted from a full queue still reaches the store"""
+    agent = HomeLabGuardian(Settings(store_path=str(tmp_path / "events.db")))
+    agent.queue = AnalysisQueue(maxsize=1)
+
+    agent._ingest(make_event("sudo", "medium", "alice"))
+    agent._ingest(make_event(username="bob"))
+    agent.store.flush()
+
+    assert agent.store.count(username="alice", event_type="sudo") == 1
+    assert agent.store.count(username="bob") == 0  # still queued
+    assert agent.queue.close()[0].event.username == "bob"
+    agent.store.close()
+
+
+def test_queue_close_wakes_waiters():
+    """Test that closing the queue releases a blocked consumer"""
+    queue = AnalysisQueue()
+    results = []
+    consumer = threading.Thread(target=lambda: results.append(queue.get()))
+    consumer.start()
+
+    queue.close()
+    consumer.join(timeout=5)
+
+    assert results == [None]
+
+
+def test_min_severity_gate(make_event):
+    """Test that min_severity filters events before analysis"""
+    assert severity_at_least("high", "medium")
+    assert not severity_at_least("low", "medium")
+
+    agent = HomeLabGuardian(Settings(store_path="", min_severity="high"))
+
+    assert agent._should_alert(make_event())
+    assert not agent._should_alert(make_event("sudo", "medium"))
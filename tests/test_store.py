@@ -0,0 +1,100 @@
+"""Tests for the SQLite event store"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from hlg.ai.analyzer import ThreatAnalysis
+from hlg.parsers.auth import parse_auth_log_line
+from hlg.store import EventStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = EventStore(str(tmp_path / "events.db"), flush_interval=0.05)
+    yield store
+    store.close()
+
+
+def test_add_and_query(store, make_event):
+    """Test that events are written in the background and read back newest first"""
+    analysis = ThreatAnalysis(
+        severity="critical", explanation="Brute force", recommendations=[], is_threat=True
+    )
+    store.add(make_event(minutes_ago=10))
+    store.add(make_event(minutes_ago=5), analysis)
+    store.add(make_event(minutes_ago=1, source_ip="2001:db8::1"))
+    store.flush()
+
+    results = store.query(source_ip="203.0.113.7")
+
+    assert len(results) == 2
+    assert results[0].verdict == "critical"
+    assert results[0].is_threat is True
+    assert results[1].verdict is None
+    assert results[0].event.username == "root"
+
+
+def test_count_and_first_seen(store, make_event):
+    """Test indexed aggregate lookups"""
+    for minutes in (120, 30, 10):
+        store.add(make_event(minutes_ago=minutes))
+    store.add(make_event("invalid_user", username="admin", minutes_ago=5))
+    store.flush()
+
+    since = datetime.now() - timedelta(hours=1)
+    assert store.count(source_ip="203.0.113.7") == 4
+    assert store.count(source_ip="203.0.113.7", since=since) == 3
+    assert store.count(username="admin", event_type="invalid_user") == 1
+    assert store.count(source_ip="192.0.2.1") == 0
+
+    first = store.first_seen(source_ip="203.0.113.7")
+    assert first is not None
+    assert datetime.now() - first > timedelta(minutes=119)
+    assert store.first_seen(source_ip="192.0.2.1") is None
+
+
+def test_compact_applies_retention(store, make_event):
+    """Test that compaction drops events older than the retention period"""
+    store.add(make_event(minutes_ago=60 * 24 * 40))
+    store.add(make_event(minutes_ago=1))
+    store.flush()
+
+    removed = store.compact(retention_days=30)
+
+    assert removed == 1
+    assert store.count() == 1
+
+
+def test_parsed_event_is_recent(store):
+    """Test that a freshly parsed auth.log line lands inside `since` and survives compaction"""
+    stamp = (datetime.now() - timedelta(minutes=1)).strftime("%b %d %H:%M:%S")
+    event = parse_auth_log_line(
+        f"{stamp} labhost sshd[1234]: Failed password for root from 203.0.113.7 port 22 ssh2"
+    )
+    assert event is not None
+    store.add(event)
+    store.flush()
+
+    assert store.count(source_ip="203.0.113.7", since=datetime.now() - timedelta(hours=24)) == 1
+    assert store.compact(retention_days=30) == 0
+    assert store.count() == 1
+
+
+def test_compact_zero_retention_is_explicit(store, make_event):
+    """Test that retention_days=0 drops everything rather than falling back to the default"""
+    store.add(make_event(minutes_ago=5))
+    store.flush()
+
+    assert store.compact(retention_days=0) == 1
+
+
+def test_add_after_close_warns(tmp_path, make_event, capsys):
+    """Test that a late add() is reported instead of silently queued behind the stop marker"""
+    store = EventStore(str(tmp_path / "events.db"))
+    store.close()
+
+    store.add(make_event())
+
+    assert "Event store closed" in capsys.readouterr().out
+    assert store._queue.empty()